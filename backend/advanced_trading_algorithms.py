@@ -105,8 +105,8 @@ class AdvancedTradingAlgorithms:
         
         # Feature preparation
         features = ['open', 'high', 'low', 'volume', 'volatility']
-        X = df[features].values
-        y = df['returns'].values
+        X = df[features].to_numpy(dtype=np.float32)
+        y = df['returns'].to_numpy(dtype=np.float32)
         
         # Normalize features
         scaler = MinMaxScaler()
@@ -120,6 +120,8 @@ class AdvancedTradingAlgorithms:
         # Random Forest Model
         rf_model = RandomForestRegressor(
             n_estimators=100, 
+            max_features='sqrt', 
+            n_jobs=-1, 
             random_state=42
         )
         rf_model.fit(X_train, y_train)
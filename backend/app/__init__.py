@@ -4,6 +4,7 @@ from flask_bcrypt import Bcrypt
 from flask_login import LoginManager
 from flask_cors import CORS
 from config.settings import Config
+from logging_config import setup_logging
 import os
 
 db = SQLAlchemy()
@@ -14,6 +15,9 @@ def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # Structured logging; also feeds the in-memory buffer behind /admin/errors
+    setup_logging()
+
     # Create upload directories
     os.makedirs(os.path.join(app.config['BASE_DIR'], 'uploads', 'payment_proofs'), exist_ok=True)
     app.config['UPLOAD_FOLDER'] = os.path.join(app.config['BASE_DIR'], 'uploads')
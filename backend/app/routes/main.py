@@ -1,4 +1,6 @@
 from flask import Blueprint, jsonify, render_template
+from flask_login import login_required, current_user
+from logging_config import recent_errors
 
 # Create the main blueprint
 main_bp = Blueprint('main', __name__)
@@ -27,6 +29,17 @@ def health_check():
         }
     }), 200
 
+@main_bp.route('/admin/errors')
+@login_required
+def get_recent_errors():
+    """
+    Most recent application errors from the in-memory log buffer (admin only)
+    """
+    if not current_user.is_admin:
+        return jsonify({'error': 'Unauthorized access'}), 403
+
+    return jsonify({'errors': recent_errors()}), 200
+
 @main_bp.errorhandler(404)
 def not_found_error(error):
     """
@@ -1,20 +1,28 @@
 import os
 import re
+import math
+import time
 import uuid
 import logging
 import hashlib
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 import jwt
 import bcrypt
 import cryptography
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 import base64
 
+# PBKDF2 iteration count, calibrated once per process
+_PBKDF2_ITERATIONS: Optional[int] = None
+
 class ComprehensiveSecurity:
     """
     Advanced Security Audit and Hardening Framework
@@ -42,6 +50,10 @@ class ComprehensiveSecurity:
         
         # Load configuration
         self.config = self._load_config(config_path)
+        
+        # Ed25519 signing key for JWTs; verifiers only need the public key
+        self._jwt_private_key = ed25519.Ed25519PrivateKey.generate()
+        self._jwt_public_key = self._jwt_private_key.public_key()
     
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """
@@ -62,6 +74,8 @@ class ComprehensiveSecurity:
                 'special_chars': 1
             },
             'jwt_expiration': 3600,  # 1 hour
+            'pbkdf2_target_seconds': 0.25,
+            'pbkdf2_min_iterations': 100000,
             'encryption_key_length': 32,
             'rate_limit': {
                 'login_attempts': 5,
@@ -80,12 +94,18 @@ class ComprehensiveSecurity:
         
         return default_config
     
-    def validate_password_strength(self, password: str) -> Dict[str, Any]:
+    def validate_password_strength(
+        self, 
+        password: str, 
+        fast_fail: bool = False
+    ) -> Dict[str, Any]:
         """
         Comprehensive password strength validation
         
         Args:
             password: Password to validate
+            fast_fail: Return at the first failing check and skip the
+                entropy calculation (for pass/fail callers such as login)
         
         Returns:
             Validation result with detailed feedback
@@ -102,6 +122,8 @@ class ComprehensiveSecurity:
             results['feedback'].append(
                 f"Password must be at least {self.config['password_min_length']} characters"
             )
+            if fast_fail:
+                return results
         
         # Complexity checks
         complexity_checks = {
@@ -120,13 +142,115 @@ class ComprehensiveSecurity:
                 results['feedback'].append(
                     f"Password must contain at least {required} {check} character(s)"
                 )
+                if fast_fail:
+                    return results
+        
+        if fast_fail:
+            return results
         
         # Entropy calculation
         char_set_size = len(set(password))
-        results['entropy'] = len(password) * math.log2(char_set_size)
+        if char_set_size:
+            results['entropy'] = len(password) * math.log2(char_set_size)
         
         return results
     
+    def _derive_password_key(
+        self, 
+        password: str, 
+        salt: bytes, 
+        iterations: int
+    ) -> bytes:
+        """
+        Derive a PBKDF2-HMAC-SHA256 key from a password
+        
+        Args:
+            password: Plain text password
+            salt: Random salt
+            iterations: PBKDF2 iteration count
+        
+        Returns:
+            Derived key bytes
+        """
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=iterations,
+            backend=default_backend()
+        )
+        return kdf.derive(password.encode('utf-8'))
+    
+    def get_pbkdf2_iterations(self) -> int:
+        """
+        Calibrate the PBKDF2 work factor for this host
+        
+        Times a probe derivation once per process and scales the iteration
+        count so a single hash takes roughly ``pbkdf2_target_seconds``.
+        
+        Returns:
+            PBKDF2 iteration count
+        """
+        global _PBKDF2_ITERATIONS
+        
+        if _PBKDF2_ITERATIONS is None:
+            probe_iterations = 10000
+            start = time.perf_counter()
+            self._derive_password_key('calibration', b'\x00' * 16, probe_iterations)
+            elapsed = max(time.perf_counter() - start, 1e-6)
+            
+            target = self.config['pbkdf2_target_seconds']
+            _PBKDF2_ITERATIONS = max(
+                self.config['pbkdf2_min_iterations'],
+                int(probe_iterations * target / elapsed)
+            )
+            self.logger.info(f"PBKDF2 calibrated to {_PBKDF2_ITERATIONS} iterations")
+        
+        return _PBKDF2_ITERATIONS
+    
+    def hash_password(self, password: str) -> str:
+        """
+        Hash a password with calibrated PBKDF2
+        
+        Args:
+            password: Plain text password
+        
+        Returns:
+            Encoded hash in ``pbkdf2_sha256$iterations$salt$hash`` form
+        """
+        iterations = self.get_pbkdf2_iterations()
+        salt = secrets.token_bytes(16)
+        key = self._derive_password_key(password, salt, iterations)
+        
+        return '$'.join([
+            'pbkdf2_sha256',
+            str(iterations),
+            base64.urlsafe_b64encode(salt).decode('utf-8'),
+            base64.urlsafe_b64encode(key).decode('utf-8')
+        ])
+    
+    def verify_password(self, password: str, stored_hash: str) -> bool:
+        """
+        Verify a password against a stored PBKDF2 hash
+        
+        Args:
+            password: Plain text password
+            stored_hash: Hash produced by ``hash_password``
+        
+        Returns:
+            Boolean indicating a match
+        """
+        try:
+            _, iterations, salt, key = stored_hash.split('$')
+            derived = self._derive_password_key(
+                password, 
+                base64.urlsafe_b64decode(salt), 
+                int(iterations)
+            )
+            return secrets.compare_digest(derived, base64.urlsafe_b64decode(key))
+        except Exception:
+            return False
+    
     def generate_secure_token(
         self, 
         user_id: str, 
@@ -143,42 +267,55 @@ class ComprehensiveSecurity:
             Token generation result
         """
         try:
-            # Generate cryptographically secure secret
-            secret = secrets.token_hex(32)
-            
             # JWT payload
             payload = {
                 'user_id': user_id,
                 'username': username,
-                'exp': datetime.utcnow() + timedelta(
-                    seconds=self.config['jwt_expiration']
-                ),
+                # Epoch seconds avoid a datetime allocation per token
+                'exp': int(time.time()) + self.config['jwt_expiration'],
                 'jti': str(uuid.uuid4())  # Unique token identifier
             }
             
             # Generate JWT
             token = jwt.encode(
                 payload, 
-                secret, 
-                algorithm='HS256'
+                self._jwt_private_key, 
+                algorithm='EdDSA'
             )
             
             return {
                 'token': token,
-                'secret': secret
+                'public_key': self.get_jwt_public_key()
             }
         
         except Exception as e:
             self.logger.error(f"Token generation error: {e}")
             return {}
     
-    def validate_jwt(self, token: str, secret: str) -> Dict[str, Any]:
+    def get_jwt_public_key(self) -> str:
+        """
+        Export the JWT verification key
+        
+        Returns:
+            PEM encoded Ed25519 public key
+        """
+        return self._jwt_public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode('utf-8')
+    
+    def validate_jwt(
+        self, 
+        token: str, 
+        public_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Validate JWT token
         
         Args:
             token: JWT token
-            secret: Secret key
+            public_key: Optional PEM encoded Ed25519 public key
+                (defaults to this instance's signing key)
         
         Returns:
             Decoded token or validation error
@@ -186,8 +323,8 @@ class ComprehensiveSecurity:
         try:
             decoded = jwt.decode(
                 token, 
-                secret, 
-                algorithms=['HS256']
+                public_key or self._jwt_public_key, 
+                algorithms=['EdDSA']
             )
             return decoded
         except jwt.ExpiredSignatureError:
@@ -267,8 +404,11 @@ class ComprehensiveSecurity:
             self._check_dependency_vulnerabilities
         ]
         
-        for check in security_checks:
-            result = check()
+        # Checks are I/O-bound (stat, sockets, HTTP); run them concurrently
+        with ThreadPoolExecutor(max_workers=len(security_checks)) as executor:
+            results = list(executor.map(lambda check: check(), security_checks))
+        
+        for result in results:
             audit_report['checks'].append(result)
             
             if not result['passed']:
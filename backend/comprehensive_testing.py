@@ -5,7 +5,7 @@ import json
 from typing import Dict, Any
 import requests
 from faker import Faker
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
 
 class ComprehensiveTestSuite:
     """
@@ -28,6 +28,9 @@ class ComprehensiveTestSuite:
         """
         self.base_url = base_url
         self.faker = Faker()
+        
+        # Keep-alive session so repeated API calls reuse one connection
+        self.session = requests.Session()
     
     def generate_test_user(self) -> Dict[str, Any]:
         """
@@ -58,7 +61,7 @@ class ComprehensiveTestSuite:
         Returns:
             Boolean indicating registration success
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/auth/register", 
             json=user_data
         )
@@ -75,7 +78,7 @@ class ComprehensiveTestSuite:
         Returns:
             Boolean indicating login success
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/auth/login", 
             json={'username': username, 'password': password}
         )
@@ -91,7 +94,7 @@ class ComprehensiveTestSuite:
         headers = {'Authorization': f'Bearer {token}'}
         
         # Test get trading accounts
-        accounts_response = requests.get(
+        accounts_response = self.session.get(
             f"{self.base_url}/trading/accounts", 
             headers=headers
         )
@@ -103,7 +106,7 @@ class ComprehensiveTestSuite:
             'amount': 0.01,
             'type': 'buy'
         }
-        trade_response = requests.post(
+        trade_response = self.session.post(
             f"{self.base_url}/trading/trade", 
             json=trade_data,
             headers=headers
@@ -122,12 +125,13 @@ class ComprehensiveTestSuite:
         Args:
             invalid_data: Invalid login credentials
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/auth/login", 
             json=invalid_data
         )
         assert response.status_code == 400
     
+    @settings(deadline=None)
     @given(
         st.text(min_size=1, max_size=50),
         st.text(min_size=8, max_size=50)
@@ -140,7 +144,7 @@ class ComprehensiveTestSuite:
             username: Generated username
             password: Generated password
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/auth/login", 
             json={'username': username, 'password': password}
         )
@@ -1,10 +1,12 @@
+import io
 import os
 import sys
 import traceback
 
 # Ensure backend directory is in Python path
 backend_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, backend_dir)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
 
 def debug_import_path():
     """
@@ -64,13 +66,17 @@ def debug_routes():
         # Create Flask application context
         app = create_app()
 
-        # Capture and print all routes
-        print("\n🗺️ Registered Routes:")
+        # Capture all routes and emit them in a single write
+        buffer = io.StringIO()
+        buffer.write("\n🗺️ Registered Routes:\n")
         for rule in app.url_map.iter_rules():
-            print(f"   🔗 {rule.endpoint}")
-            print(f"      Path: {rule}")
-            print(f"      Methods: {list(rule.methods)}")
-            print("---")
+            buffer.write(
+                f"   🔗 {rule.endpoint}\n"
+                f"      Path: {rule}\n"
+                f"      Methods: {list(rule.methods)}\n"
+                "---\n"
+            )
+        sys.stdout.write(buffer.getvalue())
 
         # Test route handlers
         with app.test_client() as client:
@@ -2,6 +2,7 @@ import os
 import logging
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 def setup_backend_services():
     """
@@ -16,16 +17,33 @@ def setup_backend_services():
         {'name': 'Background Task Worker', 'command': ['celery', '-A', 'tasks', 'worker']}
     ]
     
-    for service in services:
-        try:
+    # Spawn all services concurrently so their fork/exec costs overlap
+    success = True
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        futures = {}
+        for service in services:
             logger.info(f"Starting {service['name']}")
-            subprocess.Popen(service['command'])
-            logger.info(f"{service['name']} started successfully")
-        except Exception as e:
-            logger.error(f"Failed to start {service['name']}: {e}")
-            return False
+            # Skip the child's fd-closing loop (fds are non-inheritable by
+            # default) and detach each service into its own session.
+            # start_new_session rules out posix_spawn, so this still forks.
+            future = executor.submit(
+                subprocess.Popen, 
+                service['command'], 
+                close_fds=False, 
+                start_new_session=True
+            )
+            futures[future] = service
+        
+        for future in as_completed(futures):
+            service = futures[future]
+            try:
+                process = future.result()
+                logger.info(f"{service['name']} started successfully (pid {process.pid})")
+            except Exception as e:
+                logger.error(f"Failed to start {service['name']}: {e}")
+                success = False
     
-    return True
+    return success
 
 def main():
     """
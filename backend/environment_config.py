@@ -1,7 +1,103 @@
 import os
-from typing import Dict, Any
+import types
+import functools
+from typing import Dict, Any, Mapping
 from dotenv import load_dotenv
 
+_dotenv_loaded = False
+
+# Fallback secret generated once per process rather than per config build
+_FALLBACK_SECRET_KEY = os.urandom(32)
+
+_DEFAULTS = {
+    # Database Configuration
+    'DATABASE_URL': 'sqlite:///default.db',
+    'DATABASE_POOL_SIZE': 10,
+    
+    # Security Settings
+    'SECRET_KEY': _FALLBACK_SECRET_KEY,
+    'JWT_EXPIRATION_DELTA': 3600,
+    
+    # Logging Configuration
+    'LOG_LEVEL': 'INFO',
+    'LOG_FILE': 'coinage.log',
+    
+    # External Services
+    'SENTRY_DSN': '',
+    'REDIS_URL': 'redis://localhost:6379/0',
+}
+
+_INT_KEYS = frozenset({'DATABASE_POOL_SIZE', 'JWT_EXPIRATION_DELTA'})
+
+
+def _load_dotenv_once() -> None:
+    """
+    Load the .env file the first time configuration is requested
+    """
+    global _dotenv_loaded
+    
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+@functools.lru_cache(maxsize=8)
+def _get_config_cached(env: str) -> Mapping[str, Any]:
+    """
+    Build the configuration for an environment (memoized per env name)
+    
+    Args:
+        env: Normalized environment type
+    
+    Returns:
+        Read-only view of the configuration settings
+    """
+    # Base configuration: defaults overridden by any set environment variables
+    environ = os.environ
+    base_config = _DEFAULTS.copy()
+    for key in _DEFAULTS:
+        value = environ.get(key)
+        if value is not None:
+            base_config[key] = int(value) if key in _INT_KEYS else value
+    
+    # Environment-specific overrides
+    env_overrides = {
+        'development': {
+            'DEBUG': True,
+            'TESTING': False,
+            'DATABASE_URL': 'sqlite:///dev.db',
+            'LOG_LEVEL': 'DEBUG'
+        },
+        'staging': {
+            'DEBUG': False,
+            'TESTING': False,
+            'LOG_LEVEL': 'INFO'
+        },
+        'production': {
+            'DEBUG': False,
+            'TESTING': False,
+            'LOG_LEVEL': 'WARNING',
+            'JWT_EXPIRATION_DELTA': 86400  # 24 hours
+        },
+        'testing': {
+            'DEBUG': True,
+            'TESTING': True,
+            'DATABASE_URL': 'sqlite:///:memory:',
+            'LOG_LEVEL': 'ERROR'
+        }
+    }
+    
+    # Validate environment
+    if env not in env_overrides:
+        raise ValueError(f"Invalid environment: {env}")
+    
+    # Never run production on a random per-process secret
+    if env == 'production' and 'SECRET_KEY' not in environ:
+        raise ValueError("SECRET_KEY must be set in production")
+    
+    return types.MappingProxyType({**base_config, **env_overrides[env]})
+
+
 class EnvironmentConfig:
     """
     Centralized environment configuration management
@@ -13,91 +109,62 @@ class EnvironmentConfig:
     - Testing
     """
     
-    # Load environment variables
-    load_dotenv()
+    # Frozen snapshots of configs that already passed validation
+    _validated_configs: set = set()
     
     @classmethod
     def get_config(cls, env: str = None) -> Dict[str, Any]:
         """
         Retrieve configuration based on environment
         
+        Results are cached per environment name; each caller gets its own
+        copy, so changes to it do not leak to later callers.
+        
         Args:
             env: Environment type (default: detected from FLASK_ENV)
         
         Returns:
             Dictionary of configuration settings
         """
+        _load_dotenv_once()
+        
         # Detect environment if not specified
         if not env:
             env = os.getenv('FLASK_ENV', 'development').lower()
         
-        # Base configuration
-        base_config = {
-            # Database Configuration
-            'DATABASE_URL': os.getenv('DATABASE_URL', 'sqlite:///default.db'),
-            'DATABASE_POOL_SIZE': int(os.getenv('DATABASE_POOL_SIZE', 10)),
-            
-            # Security Settings
-            'SECRET_KEY': os.getenv('SECRET_KEY', os.urandom(32)),
-            'JWT_EXPIRATION_DELTA': int(os.getenv('JWT_EXPIRATION_DELTA', 3600)),
-            
-            # Logging Configuration
-            'LOG_LEVEL': os.getenv('LOG_LEVEL', 'INFO'),
-            'LOG_FILE': os.getenv('LOG_FILE', 'coinage.log'),
-            
-            # External Services
-            'SENTRY_DSN': os.getenv('SENTRY_DSN', ''),
-            'REDIS_URL': os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
-        }
-        
-        # Environment-specific overrides
-        env_configs = {
-            'development': {
-                **base_config,
-                'DEBUG': True,
-                'TESTING': False,
-                'DATABASE_URL': 'sqlite:///dev.db',
-                'LOG_LEVEL': 'DEBUG'
-            },
-            'staging': {
-                **base_config,
-                'DEBUG': False,
-                'TESTING': False,
-                'LOG_LEVEL': 'INFO'
-            },
-            'production': {
-                **base_config,
-                'DEBUG': False,
-                'TESTING': False,
-                'LOG_LEVEL': 'WARNING',
-                'JWT_EXPIRATION_DELTA': 86400  # 24 hours
-            },
-            'testing': {
-                **base_config,
-                'DEBUG': True,
-                'TESTING': True,
-                'DATABASE_URL': 'sqlite:///:memory:',
-                'LOG_LEVEL': 'ERROR'
-            }
-        }
-        
-        # Validate environment
-        if env not in env_configs:
-            raise ValueError(f"Invalid environment: {env}")
-        
-        return env_configs[env]
+        return dict(_get_config_cached(env))
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop cached configurations (e.g. after changing os.environ)
+        """
+        _get_config_cached.cache_clear()
+        cls._validated_configs.clear()
     
     @classmethod
     def validate_config(cls, config: Dict[str, Any]) -> None:
         """
         Validate configuration settings
         
+        Validation is memoized on a frozen snapshot of the settings, so a
+        config that was changed after validation is checked again.
+        
         Args:
             config: Configuration dictionary to validate
         
         Raises:
             ValueError: If configuration is invalid
         """
+        try:
+            snapshot = frozenset(config.items())
+        except TypeError:
+            # Unhashable values: validate without memoizing
+            snapshot = None
+        
+        if snapshot is not None and snapshot in cls._validated_configs:
+            return
+        
         required_keys = [
             'DATABASE_URL', 
             'SECRET_KEY', 
@@ -114,6 +181,11 @@ class EnvironmentConfig:
         
         if not isinstance(config.get('JWT_EXPIRATION_DELTA', 0), int):
             raise ValueError("JWT_EXPIRATION_DELTA must be an integer")
+        
+        if snapshot is not None:
+            if len(cls._validated_configs) >= 32:
+                cls._validated_configs.clear()
+            cls._validated_configs.add(snapshot)
     
     @classmethod
     def load_environment(cls, env: str = None) -> Dict[str, Any]:
@@ -141,7 +213,12 @@ def main():
         print(f"{key}: {value}")
     
     # Load production configuration
-    prod_config = EnvironmentConfig.load_environment('production')
+    try:
+        prod_config = EnvironmentConfig.load_environment('production')
+    except ValueError as e:
+        print(f"\nProduction Configuration unavailable: {e}")
+        return
+    
     print("\nProduction Configuration:")
     for key, value in prod_config.items():
         print(f"{key}: {value}")
@@ -1,8 +1,62 @@
 import os
 import json
+import bisect
+import mmap
 import logging
 from typing import Dict, List, Any
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON codec
+    orjson = None
+
+# Scoring categories in the positional order used by the priority formula
+SCORING_CATEGORIES = (
+    'user_impact',
+    'technical_complexity',
+    'business_value',
+    'implementation_effort'
+)
+
+
+def _load_json(filepath: str) -> Any:
+    """
+    Read a JSON document from disk
+    
+    Args:
+        filepath: Source path
+    
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is None:
+        with open(filepath, 'r') as f:
+            return json.load(f)
+    
+    # Parse straight from the mapped pages instead of an intermediate read buffer
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+            memoryview(mapped) as view:
+        return orjson.loads(view)
+
+
+def _dump_json(data: Any, filepath: str) -> None:
+    """
+    Write compact JSON to disk, preferring orjson when installed
+    
+    Args:
+        data: JSON-serializable data
+        filepath: Destination path
+    """
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+
 
 class FeaturePrioritizationFramework:
     def __init__(
@@ -50,6 +104,46 @@ class FeaturePrioritizationFramework:
                 'high': 1
             }
         }
+        
+        # In-memory index of feature requests keyed by feature_id
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self.reload_feature_requests()
+    
+    def reload_feature_requests(self) -> None:
+        """
+        Rebuild the in-memory index from the feature request directory
+        """
+        with os.scandir(self.feature_request_dir) as entries:
+            paths = [
+                entry.path for entry in entries
+                if entry.name.endswith('_feature_request.json')
+            ]
+        
+        # File reads are I/O-bound; spread them across a thread pool
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            feature_requests = list(executor.map(_load_json, paths))
+        
+        index = {
+            feature_request['feature_id']: feature_request
+            for feature_request in feature_requests
+        }
+        
+        self._index = index
+    
+    def _feature_request_path(self, feature_id: str) -> str:
+        """
+        Build the storage path for a feature request
+        
+        Args:
+            feature_id: Feature request identifier
+        
+        Returns:
+            Path of the feature request JSON file
+        """
+        return os.path.join(
+            self.feature_request_dir, 
+            f"{feature_id}_feature_request.json"
+        )
     
     def submit_feature_request(
         self, 
@@ -76,29 +170,22 @@ class FeaturePrioritizationFramework:
         Returns:
             Feature request details
         """
+        now = datetime.now()
+        criteria = self.scoring_criteria
+        levels = zip(
+            SCORING_CATEGORIES, 
+            (user_impact, technical_complexity, business_value, implementation_effort)
+        )
+        
         feature_request = {
-            'feature_id': f"FEAT_{datetime.now().strftime('%Y%m%d%H%M%S')}",
+            'feature_id': f"FEAT_{now.strftime('%Y%m%d%H%M%S')}",
             'feature_name': feature_name,
             'description': description,
             'requester': requester,
-            'submission_date': datetime.now().isoformat(),
+            'submission_date': now.isoformat(),
             'scoring': {
-                'user_impact': {
-                    'level': user_impact,
-                    'score': self.scoring_criteria['user_impact'][user_impact]
-                },
-                'technical_complexity': {
-                    'level': technical_complexity,
-                    'score': self.scoring_criteria['technical_complexity'][technical_complexity]
-                },
-                'business_value': {
-                    'level': business_value,
-                    'score': self.scoring_criteria['business_value'][business_value]
-                },
-                'implementation_effort': {
-                    'level': implementation_effort,
-                    'score': self.scoring_criteria['implementation_effort'][implementation_effort]
-                }
+                category: {'level': level, 'score': criteria[category][level]}
+                for category, level in levels
             },
             'status': 'pending'
         }
@@ -107,11 +194,12 @@ class FeaturePrioritizationFramework:
         feature_request['priority_score'] = self._calculate_priority_score(feature_request)
         
         # Save feature request
-        filename = f"{feature_request['feature_id']}_feature_request.json"
-        filepath = os.path.join(self.feature_request_dir, filename)
+        _dump_json(
+            feature_request, 
+            self._feature_request_path(feature_request['feature_id'])
+        )
         
-        with open(filepath, 'w') as f:
-            json.dump(feature_request, f, indent=2)
+        self._index[feature_request['feature_id']] = feature_request
         
         self.logger.info(f"Feature request submitted: {feature_name}")
         return feature_request
@@ -127,45 +215,48 @@ class FeaturePrioritizationFramework:
             Calculated priority score
         """
         scoring = feature_request['scoring']
+        user_impact, technical_complexity, business_value, implementation_effort = (
+            scoring[category]['score'] for category in SCORING_CATEGORIES
+        )
         
         # Weighted scoring formula
         priority_score = (
-            scoring['user_impact']['score'] * 0.3 +
-            (6 - scoring['technical_complexity']['score']) * 0.2 +
-            scoring['business_value']['score'] * 0.3 +
-            (6 - scoring['implementation_effort']['score']) * 0.2
+            user_impact * 0.3 +
+            (6 - technical_complexity) * 0.2 +
+            business_value * 0.3 +
+            (6 - implementation_effort) * 0.2
         )
         
         return round(priority_score, 2)
     
-    def get_feature_requests(self, status: str = None) -> List[Dict[str, Any]]:
+    def get_feature_requests(
+        self, 
+        status: str = None, 
+        sort: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Retrieve feature requests
         
         Args:
             status: Optional status filter
+            sort: Sort by priority score (descending); pass False when
+                order does not matter
         
         Returns:
             List of feature requests
         """
-        feature_requests = []
-        
-        for filename in os.listdir(self.feature_request_dir):
-            if filename.endswith('_feature_request.json'):
-                filepath = os.path.join(self.feature_request_dir, filename)
-                
-                with open(filepath, 'r') as f:
-                    feature_request = json.load(f)
-                
-                if status is None or feature_request['status'] == status:
-                    feature_requests.append(feature_request)
+        feature_requests = [
+            feature_request
+            for feature_request in self._index.values()
+            if status is None or feature_request['status'] == status
+        ]
+        
+        if not sort:
+            return feature_requests
         
         # Sort by priority score in descending order
-        return sorted(
-            feature_requests, 
-            key=lambda x: x['priority_score'], 
-            reverse=True
-        )
+        feature_requests.sort(key=lambda x: x['priority_score'], reverse=True)
+        return feature_requests
     
     def update_feature_request_status(
         self, 
@@ -182,23 +273,24 @@ class FeaturePrioritizationFramework:
         Returns:
             Boolean indicating successful update
         """
-        for filename in os.listdir(self.feature_request_dir):
-            if filename.endswith('_feature_request.json'):
-                filepath = os.path.join(self.feature_request_dir, filename)
-                
-                with open(filepath, 'r') as f:
-                    feature_request = json.load(f)
-                
-                if feature_request['feature_id'] == feature_id:
-                    feature_request['status'] = new_status
-                    
-                    with open(filepath, 'w') as f:
-                        json.dump(feature_request, f, indent=2)
-                    
-                    self.logger.info(f"Updated feature {feature_id} status to {new_status}")
-                    return True
-        
-        return False
+        feature_request = self._index.get(feature_id)
+        filepath = self._feature_request_path(feature_id)
+        
+        if feature_request is None:
+            # Not indexed yet (e.g. written by another process); the
+            # filename encodes the feature_id, so no directory scan is needed
+            if not os.path.exists(filepath):
+                return False
+            
+            feature_request = _load_json(filepath)
+            self._index[feature_id] = feature_request
+        
+        feature_request['status'] = new_status
+        
+        _dump_json(feature_request, filepath)
+        
+        self.logger.info(f"Updated feature {feature_id} status to {new_status}")
+        return True
     
     def generate_feature_roadmap(self) -> Dict[str, Any]:
         """
@@ -209,20 +301,18 @@ class FeaturePrioritizationFramework:
         """
         feature_requests = self.get_feature_requests()
         
+        # The list is sorted once (descending), so each bucket is a contiguous
+        # slice; locate the boundaries with bisect on the negated scores
+        negated_scores = [-feature['priority_score'] for feature in feature_requests]
+        short_end = bisect.bisect_right(negated_scores, -4.5)
+        medium_end = bisect.bisect_right(negated_scores, -3.5)
+        
         roadmap = {
-            'short_term': [],
-            'medium_term': [],
-            'long_term': []
+            'short_term': feature_requests[:short_end],
+            'medium_term': feature_requests[short_end:medium_end],
+            'long_term': feature_requests[medium_end:]
         }
         
-        for feature in feature_requests:
-            if feature['priority_score'] >= 4.5:
-                roadmap['short_term'].append(feature)
-            elif feature['priority_score'] >= 3.5:
-                roadmap['medium_term'].append(feature)
-            else:
-                roadmap['long_term'].append(feature)
-        
         return roadmap
 
 def main():
@@ -254,8 +344,7 @@ def main():
     feature_roadmap = feature_manager.generate_feature_roadmap()
     
     # Save roadmap
-    with open('feature_roadmap.json', 'w') as f:
-        json.dump(feature_roadmap, f, indent=2)
+    _dump_json(feature_roadmap, 'feature_roadmap.json')
     
     print("Feature Roadmap Generated:")
     print(json.dumps(feature_roadmap, indent=2))
@@ -1,11 +1,14 @@
 import os
 import sys
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate, init, migrate, upgrade
 
 # Add the backend directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+if backend_dir not in sys.path:
+    sys.path.append(backend_dir)
+
+import lazy_app
+
+MIGRATION_COMMANDS = ('init', 'migrate', 'upgrade')
 
 def run_migrations(command='upgrade'):
     """
@@ -13,15 +16,20 @@ def run_migrations(command='upgrade'):
     
     :param command: Migration command to run (init, migrate, upgrade)
     """
+    # Reject unknown commands before paying for the Flask/SQLAlchemy imports
+    if command not in MIGRATION_COMMANDS:
+        print(f"❌ Unknown migration command: {command}")
+        sys.exit(1)
+
     try:
-        # Import create_app and db
-        from app import create_app, db
+        flask_migrate = lazy_app.lazy_import('flask_migrate')
 
         # Create the Flask application
-        app = create_app()
+        app = lazy_app.app.create_app()
+        db = lazy_app.app.db
 
         # Initialize Flask-Migrate
-        migrate_instance = Migrate(app, db)
+        migrate_instance = flask_migrate.Migrate(app, db)
 
         # Run migrations in application context
         with app.app_context():
@@ -30,17 +38,14 @@ def run_migrations(command='upgrade'):
 
             # Perform specific migration command
             if command == 'init':
-                init()
+                flask_migrate.init()
                 print("🎉 Migrations initialized successfully!")
             elif command == 'migrate':
-                migrate(message="Automatic migration")
+                flask_migrate.migrate(message="Automatic migration")
                 print("🚀 Migration script created successfully!")
             elif command == 'upgrade':
-                upgrade()
+                flask_migrate.upgrade()
                 print("✨ Database upgraded successfully!")
-            else:
-                print(f"❌ Unknown migration command: {command}")
-                sys.exit(1)
 
     except Exception as e:
         print(f"❌ Migration error: {e}")
@@ -53,7 +58,7 @@ def main():
     Main entry point for migration management
     """
     # Check if a command is provided
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or sys.argv[1] in ('-h', '--help'):
         print("Usage: python flask_migrate_manager.py [init|migrate|upgrade]")
         sys.exit(1)
 
@@ -1,7 +1,27 @@
+import io
 import os
 import sys
-import socket
-import requests
+
+import lazy_app
+
+_SESSION = None
+
+def _get_session():
+    """
+    Return a module-level keep-alive HTTP session, created on first use
+    """
+    global _SESSION
+    
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        _SESSION.mount('http://', adapter)
+        _SESSION.mount('https://', adapter)
+    
+    return _SESSION
 
 def check_server_health(url='http://127.0.0.1:5000'):
     """
@@ -10,19 +30,22 @@ def check_server_health(url='http://127.0.0.1:5000'):
     print("🩺 Coinage Application Health Check")
     print("----------------------------------")
     
+    import requests
+    session = _get_session()
+    
     # Network Connectivity
     print("\n🌐 Network Connectivity:")
     try:
-        socket.create_connection(("127.0.0.1", 5000), timeout=5)
+        session.head(url, timeout=5)
         print("✅ Local server port is open")
-    except (socket.error, socket.timeout):
+    except requests.RequestException:
         print("❌ Cannot connect to local server")
         return False
     
     # Server Endpoint Health
     print("\n🚦 Endpoint Health:")
     try:
-        response = requests.get(url, timeout=5)
+        response = session.get(url, timeout=5)
         print(f"✅ Root Endpoint Status: {response.status_code}")
         
         # Check response content
@@ -34,9 +57,11 @@ def check_server_health(url='http://127.0.0.1:5000'):
             # Try to parse JSON if possible
             try:
                 json_response = response.json()
-                print("   Response JSON:")
+                buffer = io.StringIO()
+                buffer.write("   Response JSON:\n")
                 for key, value in json_response.items():
-                    print(f"   - {key}: {value}")
+                    buffer.write(f"   - {key}: {value}\n")
+                sys.stdout.write(buffer.getvalue())
             except ValueError:
                 print("   Response is not JSON")
         
@@ -47,9 +72,8 @@ def check_server_health(url='http://127.0.0.1:5000'):
     # Database Connection (via app)
     print("\n💾 Database Connection:")
     try:
-        from app import create_app, db
-        
-        app = create_app()
+        app = lazy_app.app.create_app()
+        db = lazy_app.app.db
         with app.app_context():
             # Simple database query
             result = db.session.execute('SELECT 1')
@@ -2,31 +2,35 @@ import os
 import sys
 
 # Ensure backend directory is in Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+if backend_dir not in sys.path:
+    sys.path.append(backend_dir)
+
+import lazy_app
 
 def initialize_database():
     """
     Comprehensive database initialization and verification
     """
     try:
-        from app import create_app, db
         from app.models.user import User, TradingAccount, Transaction, ManualPaymentRequest
         from sqlalchemy import inspect
 
         # Create Flask application context
-        app = create_app()
+        app = lazy_app.app.create_app()
+        db = lazy_app.app.db
 
         with app.app_context():
             print("🚀 Database Initialization Process")
             print("--------------------------------")
 
-            # Drop all existing tables (use with caution in production)
-            print("\n🧹 Clearing Existing Database...")
-            db.drop_all()
+            # Drop and recreate all tables in one transaction (use with caution in production)
+            with db.engine.begin() as connection:
+                print("\n🧹 Clearing Existing Database...")
+                db.metadata.drop_all(bind=connection)
 
-            # Create all database tables
-            print("\n🏗️ Creating Database Tables...")
-            db.create_all()
+                print("\n🏗️ Creating Database Tables...")
+                db.metadata.create_all(bind=connection)
 
             # Verify table creation using SQLAlchemy inspector
             print("\n📊 Database Tables:")
@@ -52,8 +56,10 @@ def initialize_database():
                 is_admin=True
             )
             admin_user.set_password('admin_password')
-            
-            db.session.add(admin_user)
+
+            # Seed rows are inserted in a single batch
+            seed_users = [admin_user]
+            db.session.bulk_save_objects(seed_users)
             db.session.commit()
 
             print(f"\n✅ Database Initialization Complete!")
@@ -1,5 +1,7 @@
 import os
 import time
+import functools
+import types
 import asyncio
 import multiprocessing
 import logging
@@ -7,16 +9,141 @@ from typing import Dict, List, Any, Optional
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
+from cachetools import TTLCache
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from investment_plans import InvestmentPlan, InvestmentPlanManager
-from investment_plan_validator import InvestmentPlanValidator
+from investment_plan_validator import (
+    InvestmentPlanValidator,
+    asset_parameters,
+    portfolio_loadings,
+    sample_portfolio_returns,
+    mc_portfolio_returns
+)
 
 Base = declarative_base()
 
+def _simulate_vectorized(
+    plan: Dict[str, Any], 
+    simulations: int, 
+    investment_amount: float = 10000
+) -> Dict[str, Any]:
+    """
+    Vectorized Monte Carlo simulation of a plan
+    
+    Draws every (simulation, asset) return in one call and reduces them
+    with a single matrix-vector product against the allocation weights,
+    or runs the compiled Numba kernel when Numba is installed.
+    Uses the same asset assumptions as
+    ``InvestmentPlanValidator.simulate_investment_performance``.
+    
+    Args:
+        plan: Investment plan configuration
+        simulations: Number of simulation runs
+        investment_amount: Initial investment amount
+    
+    Returns:
+        Performance simulation results
+    """
+    allocation = plan.get('asset_allocation', {})
+    
+    weights = np.fromiter(allocation.values(), dtype=np.float64, count=len(allocation))
+    expected, loadings = portfolio_loadings(
+        weights, *asset_parameters(tuple(allocation))
+    )
+    
+    if mc_portfolio_returns is not None:
+        portfolio_returns = mc_portfolio_returns(expected, loadings, simulations)
+    else:
+        portfolio_returns = sample_portfolio_returns(
+            np.random.default_rng(), simulations, expected, loadings
+        )
+    
+    final_values = investment_amount * (1 + portfolio_returns)
+    
+    # One partition pass yields min, VaR, median and max together
+    min_value, var_95, median_value, max_value = np.percentile(
+        final_values, (0, 5, 50, 100)
+    )
+    
+    return {
+        'mean_final_value': float(final_values.mean()),
+        'median_final_value': float(median_value),
+        'min_final_value': float(min_value),
+        'max_final_value': float(max_value),
+        'value_at_risk_95': float(var_95),
+        'success_probability': float(np.count_nonzero(portfolio_returns > 0) / simulations)
+    }
+
+# Target allocations for the fixed-weight strategies
+GROWTH_ALLOCATION = {
+    'stocks': 0.7,
+    'crypto': 0.2,
+    'alternative_investments': 0.1
+}
+
+STABILITY_ALLOCATION = {
+    'bonds': 0.6,
+    'cash': 0.3,
+    'real_estate': 0.1
+}
+
+# Reported for plans whose weights cannot be normalized
+INVALID_ALLOCATION_MESSAGE = 'Asset allocation weights must sum to a positive total'
+
+def _as_arrays(allocation: Dict[str, float]):
+    """
+    Split an asset allocation into parallel name and weight arrays
+    
+    Args:
+        allocation: Asset name to weight mapping
+    
+    Returns:
+        Tuple of (asset names, weight array)
+    """
+    names = list(allocation)
+    weights = np.fromiter(allocation.values(), dtype=float, count=len(names))
+    return names, weights
+
+def _simulate_one(plan: Dict[str, Any], simulations: int) -> Dict[str, Any]:
+    """
+    Simulate performance for a single plan (process pool worker)
+    """
+    return {
+        'plan_name': plan.get('name', 'Unnamed Plan'),
+        'performance': _simulate_vectorized(plan, simulations)
+    }
+
+# Per-process validator, created once by _get_validator
+_VALIDATOR = None
+
+def _get_validator() -> InvestmentPlanValidator:
+    """
+    Return this process's shared validator, creating it on first use
+    
+    Also used as the process pool initializer so each worker builds its
+    validator once, up front.
+    """
+    global _VALIDATOR
+    
+    if _VALIDATOR is None:
+        _VALIDATOR = InvestmentPlanValidator()
+    return _VALIDATOR
+
+def _analyze_one(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyze performance for a single plan (process pool worker)
+    """
+    recommendations = _get_validator().recommend_plan_adjustments(plan)
+    
+    return {
+        'plan_name': plan.get('name', 'Unnamed Plan'),
+        'recommendations': recommendations
+    }
+
 class InvestmentPlanPerformanceOptimizer:
     """
     Advanced Performance Optimization Framework
@@ -63,8 +190,15 @@ class InvestmentPlanPerformanceOptimizer:
         # Performance configuration
         self.max_workers = max_workers or (os.cpu_count() or 4)
         
-        # Caching mechanism
-        self.performance_cache = {}
+        # Worker processes are started on first use and reused across calls
+        self._process_pool = None
+        
+        # Caching mechanism: bounded, entries expire after an hour
+        self.performance_cache = TTLCache(maxsize=10000, ttl=3600)
+        
+        # Compile the Monte Carlo kernel up front rather than on first use
+        if mc_portfolio_returns is not None:
+            mc_portfolio_returns(0.0, np.zeros(1), 1)
     
     def optimize_plan_performance(
         self, 
@@ -81,54 +215,123 @@ class InvestmentPlanPerformanceOptimizer:
         Returns:
             Performance optimization results
         """
+        return self.optimize_many([plan_id], optimization_strategy)[plan_id]
+    
+    async def optimize_plan_performance_async(
+        self, 
+        plan_id: int, 
+        optimization_strategy: str = 'balanced'
+    ) -> Dict[str, Any]:
+        """
+        Awaitable wrapper around ``optimize_plan_performance``
+        
+        Runs the blocking database lookup on the default executor so it
+        does not stall the event loop.
+        
+        Args:
+            plan_id: Investment plan identifier
+            optimization_strategy: Performance optimization approach
+        
+        Returns:
+            Performance optimization results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, 
+            self.optimize_plan_performance, 
+            plan_id, 
+            optimization_strategy
+        )
+    
+    def optimize_many(
+        self, 
+        plan_ids: List[int], 
+        optimization_strategy: str = 'balanced'
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Optimize several investment plans with a single query
+        
+        Args:
+            plan_ids: Investment plan identifiers
+            optimization_strategy: Performance optimization approach
+        
+        Returns:
+            Performance optimization results keyed by plan identifier
+        """
         session = self.Session()
         
         try:
-            # Retrieve investment plan
-            plan = session.query(InvestmentPlan).get(plan_id)
-            
-            if not plan:
-                return {
-                    'status': 'error',
-                    'message': 'Investment plan not found'
+            # Retrieve all requested plans in one SELECT ... WHERE id IN (...)
+            # and read their fields before commit expires the instances,
+            # which would otherwise cost one refresh query per plan
+            with session.begin():
+                rows = session.execute(
+                    select(InvestmentPlan).where(InvestmentPlan.id.in_(plan_ids))
+                ).scalars().all()
+                plans_by_id = {
+                    plan.id: {
+                        'name': plan.name,
+                        'risk_level': plan.risk_level,
+                        'asset_allocation': plan.asset_allocation,
+                        'expected_return': plan.expected_return,
+                        'volatility': plan.volatility
+                    }
+                    for plan in rows
                 }
             
-            # Convert plan to dictionary
-            plan_data = {
-                'name': plan.name,
-                'risk_level': plan.risk_level,
-                'asset_allocation': plan.asset_allocation,
-                'expected_return': plan.expected_return,
-                'volatility': plan.volatility
-            }
-            
             # Select optimization strategy
-            optimization_methods = {
-                'balanced': self._balanced_optimization,
-                'aggressive': self._aggressive_optimization,
-                'conservative': self._conservative_optimization
-            }
-            
-            optimization_func = optimization_methods.get(
+            optimization_func = self._STRATEGIES.get(
                 optimization_strategy, 
-                self._balanced_optimization
+                InvestmentPlanPerformanceOptimizer._balanced_optimization
             )
             
-            # Perform optimization
-            optimization_result = optimization_func(plan_data)
+            results = {}
+            found = []
+            for plan_id in plan_ids:
+                plan_data = plans_by_id.get(plan_id)
+                
+                if plan_data is None:
+                    results[plan_id] = {
+                        'status': 'error',
+                        'message': 'Investment plan not found'
+                    }
+                    continue
+                
+                found.append((plan_id, plan_data))
             
-            return {
-                'status': 'success',
-                'original_plan': plan_data,
-                'optimized_plan': optimization_result
-            }
+            # Perform optimization; balanced plans are normalized as one batch
+            if optimization_func is InvestmentPlanPerformanceOptimizer._balanced_optimization:
+                optimized = self._balanced_optimization_batch(
+                    [plan_data for _, plan_data in found]
+                )
+            else:
+                optimized = [
+                    optimization_func(self, plan_data) for _, plan_data in found
+                ]
+            
+            for (plan_id, plan_data), optimized_plan in zip(found, optimized):
+                if optimized_plan is None:
+                    results[plan_id] = {
+                        'status': 'error',
+                        'message': INVALID_ALLOCATION_MESSAGE
+                    }
+                    continue
+                
+                results[plan_id] = {
+                    'status': 'success',
+                    'original_plan': plan_data,
+                    'optimized_plan': optimized_plan
+                }
+            
+            return results
         
         except Exception as e:
             self.logger.error(f"Performance optimization error: {e}")
-            return {
+            error = {
                 'status': 'error',
                 'message': str(e)
             }
+            return {plan_id: error for plan_id in plan_ids}
         finally:
             session.close()
     
@@ -145,58 +348,102 @@ class InvestmentPlanPerformanceOptimizer:
         Returns:
             Optimized plan configuration
         """
-        # Create copy to avoid modifying original
-        optimized_plan = plan_data.copy()
-        
         # Rebalance asset allocation
-        allocation = optimized_plan.get('asset_allocation', {})
-        total_allocation = sum(allocation.values())
+        names, weights = _as_arrays(plan_data.get('asset_allocation', {}))
+        
+        total = weights.sum()
+        if not total > 0:
+            raise ValueError(INVALID_ALLOCATION_MESSAGE)
         
         # Normalize allocation
-        normalized_allocation = {
-            asset: weight / total_allocation 
-            for asset, weight in allocation.items()
-        }
+        weights = weights / total
+        
+        return self._rebalanced_plan(plan_data, names, weights)
+    
+    def _balanced_optimization_batch(
+        self, 
+        plans_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Balanced performance optimization for several plans at once
         
-        # Adjust volatility and return
-        optimized_plan['volatility'] *= 0.9  # Reduce volatility
-        optimized_plan['expected_return'] *= 1.05  # Slight return boost
+        All weights are stacked into one zero-padded matrix so the
+        normalization is a single vector operation.
         
-        # Update asset allocation
-        optimized_plan['asset_allocation'] = normalized_allocation
+        Args:
+            plans_data: Investment plan configurations
         
-        return optimized_plan
+        Returns:
+            Optimized plan configurations, in input order; None for plans
+            whose weights do not sum to a positive total
+        """
+        if not plans_data:
+            return []
+        
+        arrays = [
+            _as_arrays(plan_data.get('asset_allocation', {}))
+            for plan_data in plans_data
+        ]
+        
+        width = max(len(names) for names, _ in arrays)
+        weight_matrix = np.zeros((len(arrays), width))
+        for row, (_, weights) in enumerate(arrays):
+            weight_matrix[row, :len(weights)] = weights
+        
+        # Normalize every valid plan's allocation in one pass
+        totals = weight_matrix.sum(axis=1)
+        valid = totals > 0
+        weight_matrix[valid] /= totals[valid, np.newaxis]
+        
+        return [
+            self._rebalanced_plan(plan_data, names, weight_matrix[row, :len(names)])
+            if valid[row] else None
+            for row, (plan_data, (names, _)) in enumerate(zip(plans_data, arrays))
+        ]
     
-    def _aggressive_optimization(
+    def _rebalanced_plan(
         self, 
-        plan_data: Dict[str, Any]
+        plan_data: Dict[str, Any], 
+        names: List[str], 
+        weights: np.ndarray
     ) -> Dict[str, Any]:
         """
-        Aggressive performance optimization
+        Build a balanced plan from normalized weights
         
         Args:
             plan_data: Investment plan configuration
+            names: Asset names
+            weights: Normalized weights aligned with ``names``
         
         Returns:
             Optimized plan configuration
         """
-        optimized_plan = plan_data.copy()
-        
-        # Increase high-growth asset allocation
-        allocation = optimized_plan.get('asset_allocation', {})
-        
-        # Prioritize high-growth assets
-        growth_priority = {
-            'stocks': 0.7,
-            'crypto': 0.2,
-            'alternative_investments': 0.1
+        # Build the result in one pass, overriding only the changed fields
+        return {
+            **plan_data,
+            'volatility': plan_data['volatility'] * 0.9,  # Reduce volatility
+            'expected_return': plan_data['expected_return'] * 1.05,  # Slight return boost
+            'asset_allocation': dict(zip(names, weights.tolist()))
         }
+    
+    def _aggressive_optimization(
+        self, 
+        plan_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Aggressive performance optimization
         
-        optimized_plan['asset_allocation'] = growth_priority
-        optimized_plan['volatility'] *= 1.2  # Increased volatility
-        optimized_plan['expected_return'] *= 1.15  # Higher return potential
+        Args:
+            plan_data: Investment plan configuration
         
-        return optimized_plan
+        Returns:
+            Optimized plan configuration
+        """
+        # Prioritize high-growth assets; increased volatility,
+        # higher return potential
+        return self._target_allocation_optimization(
+            plan_data, GROWTH_ALLOCATION, 1.2, 1.15
+        )
     
     def _conservative_optimization(
         self, 
@@ -211,22 +458,46 @@ class InvestmentPlanPerformanceOptimizer:
         Returns:
             Optimized plan configuration
         """
-        optimized_plan = plan_data.copy()
-        
-        # Prioritize stable, low-risk assets
-        stability_priority = {
-            'bonds': 0.6,
-            'cash': 0.3,
-            'real_estate': 0.1
-        }
+        # Prioritize stable, low-risk assets; reduced volatility,
+        # conservative return
+        return self._target_allocation_optimization(
+            plan_data, STABILITY_ALLOCATION, 0.7, 0.9
+        )
+    
+    def _target_allocation_optimization(
+        self, 
+        plan_data: Dict[str, Any], 
+        target_allocation: Dict[str, float], 
+        volatility_factor: float, 
+        return_factor: float
+    ) -> Dict[str, Any]:
+        """
+        Move a plan onto a fixed target allocation
         
-        optimized_plan['asset_allocation'] = stability_priority
-        optimized_plan['volatility'] *= 0.7  # Reduced volatility
-        optimized_plan['expected_return'] *= 0.9  # Conservative return
+        Args:
+            plan_data: Investment plan configuration
+            target_allocation: Asset weights to apply
+            volatility_factor: Multiplier for the plan volatility
+            return_factor: Multiplier for the plan expected return
         
-        return optimized_plan
+        Returns:
+            Optimized plan configuration
+        """
+        return {
+            **plan_data,
+            'asset_allocation': dict(target_allocation),
+            'volatility': plan_data['volatility'] * volatility_factor,
+            'expected_return': plan_data['expected_return'] * return_factor
+        }
     
-    async def parallel_performance_simulation(
+    # Strategy name to (unbound) optimization method
+    _STRATEGIES = types.MappingProxyType({
+        'balanced': _balanced_optimization,
+        'aggressive': _aggressive_optimization,
+        'conservative': _conservative_optimization
+    })
+    
+    def parallel_performance_simulation(
         self, 
         plans: List[Dict[str, Any]], 
         simulations: int = 1000
@@ -241,23 +512,36 @@ class InvestmentPlanPerformanceOptimizer:
         Returns:
             Performance simulation results
         """
-        async def simulate_plan_performance(plan):
-            """
-            Simulate performance for a single plan
-            """
-            validator = InvestmentPlanValidator()
-            performance = validator.simulate_investment_performance(
-                plan, 
-                simulations=simulations
-            )
-            return {
-                'plan_name': plan.get('name', 'Unnamed Plan'),
-                'performance': performance
-            }
+        # CPU-bound work: spread plans across worker processes
+        chunksize = max(1, len(plans) // self.max_workers)
+        return list(self._get_process_pool().map(
+            functools.partial(_simulate_one, simulations=simulations),
+            plans,
+            chunksize=chunksize
+        ))
+    
+    async def parallel_performance_simulation_async(
+        self, 
+        plans: List[Dict[str, Any]], 
+        simulations: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Awaitable wrapper around ``parallel_performance_simulation``
         
-        # Use asyncio for concurrent simulation
-        tasks = [simulate_plan_performance(plan) for plan in plans]
-        return await asyncio.gather(*tasks)
+        Args:
+            plans: List of investment plans
+            simulations: Number of simulation runs
+        
+        Returns:
+            Performance simulation results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, 
+            self.parallel_performance_simulation, 
+            plans, 
+            simulations
+        )
     
     def multiprocess_performance_analysis(
         self, 
@@ -272,23 +556,35 @@ class InvestmentPlanPerformanceOptimizer:
         Returns:
             Performance analysis results
         """
-        def analyze_plan_performance(plan):
-            """
-            Analyze performance for a single plan
-            """
-            validator = InvestmentPlanValidator()
-            recommendations = validator.recommend_plan_adjustments(plan)
-            
-            return {
-                'plan_name': plan.get('name', 'Unnamed Plan'),
-                'recommendations': recommendations
-            }
-        
-        # Use ProcessPoolExecutor for CPU-bound tasks
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            results = list(executor.map(analyze_plan_performance, plans))
+        # Use the shared process pool for CPU-bound tasks
+        chunksize = max(1, len(plans) // self.max_workers)
+        return list(self._get_process_pool().map(
+            _analyze_one, 
+            plans, 
+            chunksize=chunksize
+        ))
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the long-lived worker pool, starting it on first use
         
-        return results
+        Returns:
+            Process pool executor
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, 
+                initializer=_get_validator
+            )
+        return self._process_pool
+    
+    def shutdown(self) -> None:
+        """
+        Stop the worker pool
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
     
     def cache_performance_results(
         self, 
@@ -302,10 +598,7 @@ class InvestmentPlanPerformanceOptimizer:
             plan_id: Investment plan identifier
             results: Performance simulation results
         """
-        self.performance_cache[plan_id] = {
-            'results': results,
-            'timestamp': time.time()
-        }
+        self.performance_cache[plan_id] = (time.time(), results)
     
     def get_cached_performance(
         self, 
@@ -324,12 +617,16 @@ class InvestmentPlanPerformanceOptimizer:
         """
         cached_result = self.performance_cache.get(plan_id)
         
-        if cached_result:
-            age = time.time() - cached_result['timestamp']
-            if age <= max_age:
-                return cached_result['results']
+        if cached_result is None:
+            return None
+        
+        # Expiry at the cache TTL is handled by TTLCache itself; only a
+        # stricter max_age needs the timestamp
+        timestamp, results = cached_result
+        if max_age < self.performance_cache.ttl and time.time() - timestamp > max_age:
+            return None
         
-        return None
+        return results
 
 def main():
     """
@@ -373,7 +670,7 @@ def main():
     
     # Parallel performance simulation
     async def run_simulation():
-        simulation_results = await optimizer.parallel_performance_simulation(plans)
+        simulation_results = await optimizer.parallel_performance_simulation_async(plans)
         print("\nParallel Performance Simulation:")
         print(simulation_results)
     
@@ -384,6 +681,8 @@ def main():
     
     # Run async simulation
     asyncio.run(run_simulation())
+    
+    optimizer.shutdown()
 
 if __name__ == '__main__':
     main()
@@ -1,17 +1,110 @@
 import os
 import re
 import json
+import time
+import base64
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from collections import deque
+from json.encoder import encode_basestring_ascii as _encode_string
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
 
 import jwt
-from cryptography.fernet import Fernet
-from sqlalchemy import create_engine
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from sqlalchemy import bindparam, create_engine, lambda_stmt, select
 from sqlalchemy.orm import sessionmaker
 
 from investment_plans import InvestmentPlan, InvestmentPlanManager
 from app.utils.security import SecurityMiddleware
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON codec
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """
+    Serialize data to compact JSON bytes, preferring orjson when installed
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def _pretty(data: Any) -> str:
+    """
+    Render data as indented JSON for display (datetimes as ISO strings)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, preferring orjson when installed
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Single-plan lookup; the lambda statement is compiled once and cached, so
+# each audit only binds a new plan id
+_GET_PLAN = lambda_stmt(
+    lambda: select(InvestmentPlan).where(InvestmentPlan.id == bindparam('pid'))
+)
+
+
+def _exceeds_size(value: Any, limit: int) -> bool:
+    """
+    Check whether ``json.dumps(value)`` would exceed ``limit`` characters
+    
+    Walks the structure breadth-first, counting characters the way
+    ``json.dumps`` lays them out, and stops as soon as the running count
+    passes the limit instead of serializing the whole value.
+    
+    Args:
+        value: Nested dict/list value
+        limit: Maximum allowed size
+    
+    Returns:
+        True if the serialized size exceeds the limit
+    """
+    size = 0
+    pending = deque([value])
+    while pending:
+        item = pending.popleft()
+        if isinstance(item, str):
+            size += len(_encode_string(item))
+        elif isinstance(item, dict):
+            # Braces, ': ' after each key and ', ' between entries
+            size += 4 * len(item) if item else 2
+            for key in item:
+                if isinstance(key, str):
+                    pending.append(key)
+                else:
+                    # Non-string keys are written as quoted JSON scalars
+                    size += len(json.dumps(key)) + 2
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            # Brackets and ', ' between items
+            size += 2 * len(item) if item else 2
+            pending.extend(item)
+        else:
+            try:
+                size += len(json.dumps(item))
+            except (TypeError, ValueError):
+                size += len(repr(item))
+        
+        if size > limit:
+            return True
+    
+    return False
+
+
 class InvestmentPlanSecurityAudit:
     """
     Comprehensive Security Audit for Investment Plans
@@ -19,6 +112,19 @@ class InvestmentPlanSecurityAudit:
     Performs multi-layered security assessments
     """
     
+    # One scanner for SQL literal breakouts, SQL comments and markup
+    _INJECTION_RE = re.compile(r'[\'";`<>]|--|/\*')
+    
+    # Maximum text size of nested configuration values
+    MAX_VALUE_SIZE = 10000
+    
+    # Plan fields encrypted at rest
+    SENSITIVE_FIELDS = frozenset((
+        'asset_allocation', 
+        'expected_return', 
+        'volatility'
+    ))
+    
     def __init__(
         self, 
         database_url: Optional[str] = None,
@@ -44,23 +150,33 @@ class InvestmentPlanSecurityAudit:
             'sqlite:///investment_plans_security.db'
         )
         self.engine = create_engine(self.database_url)
-        self.Session = sessionmaker(bind=self.engine)
+        # Audits are read-only: skip autoflush and post-commit reloads
+        self.Session = sessionmaker(
+            bind=self.engine, 
+            expire_on_commit=False, 
+            autoflush=False
+        )
         
         # Security middleware
         self.security_middleware = SecurityMiddleware()
         
         # Encryption key management
         self.encryption_key = self._generate_encryption_key()
-        self.encryption_cipher = Fernet(self.encryption_key)
+        self.encryption_cipher = AESGCM(self.encryption_key)
+        
+        # Token signing key, read once rather than per token
+        self._signing_key = os.getenv('JWT_SECRET_KEY')
     
     def _generate_encryption_key(self) -> bytes:
         """
         Generate a secure encryption key
         
+        AES-128 keeps the cipher on the shortest AES-NI round schedule.
+        
         Returns:
             Encryption key
         """
-        return Fernet.generate_key()
+        return AESGCM.generate_key(bit_length=128)
     
     def audit_investment_plan_access(
         self, 
@@ -81,38 +197,125 @@ class InvestmentPlanSecurityAudit:
         
         try:
             # Retrieve investment plan
-            plan = session.query(InvestmentPlan).get(plan_id)
-            
-            if not plan:
-                return {
-                    'status': 'error',
-                    'message': 'Investment plan not found'
-                }
-            
-            # Check user authorization
-            authorized = self._check_user_authorization(user_id, plan)
-            
-            # Log access attempt
-            self.logger.info(
-                f"Investment Plan Access Attempt: "
-                f"User {user_id}, Plan {plan_id}, Authorized: {authorized}"
-            )
+            plan = session.execute(
+                _GET_PLAN, {'pid': plan_id}
+            ).scalar_one_or_none()
             
+            return self._audit_plan_access(user_id, plan_id, plan)
+        
+        except Exception as e:
+            self.logger.error(f"Access audit error: {e}")
             return {
-                'status': 'success',
-                'authorized': authorized,
-                'risk_level': plan.risk_level
+                'status': 'error',
+                'message': str(e)
             }
+        finally:
+            session.close()
+    
+    def audit_many(
+        self, 
+        pairs: List[Tuple[int, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Audit a burst of plan accesses with a single query
+        
+        Args:
+            pairs: (user_id, plan_id) access attempts
+        
+        Returns:
+            Access audit results, in input order
+        """
+        session = self.Session()
+        
+        try:
+            plan_ids = {plan_id for _, plan_id in pairs}
+            
+            # Retrieve all requested plans in one SELECT ... WHERE id IN (...)
+            with session.begin():
+                rows = session.execute(
+                    select(InvestmentPlan).where(InvestmentPlan.id.in_(plan_ids))
+                ).scalars().all()
+                plans_by_id = {plan.id: plan for plan in rows}
+            
+            return [
+                self._audit_plan_access(user_id, plan_id, plans_by_id.get(plan_id))
+                for user_id, plan_id in pairs
+            ]
         
         except Exception as e:
             self.logger.error(f"Access audit error: {e}")
-            return {
+            error = {
                 'status': 'error',
                 'message': str(e)
             }
+            return [error] * len(pairs)
         finally:
             session.close()
     
+    def _audit_plan_access(
+        self, 
+        user_id: int, 
+        plan_id: int, 
+        plan: Optional[InvestmentPlan]
+    ) -> Dict[str, Any]:
+        """
+        Build the audit result for one loaded plan
+        
+        Args:
+            user_id: User attempting access
+            plan_id: Investment plan identifier
+            plan: Loaded investment plan, or None if missing
+        
+        Returns:
+            Access audit results
+        """
+        if not plan:
+            return {
+                'status': 'error',
+                'message': 'Investment plan not found'
+            }
+        
+        # Check user authorization
+        authorized = self._check_user_authorization(user_id, plan)
+        
+        # Log access attempt
+        self.logger.info(
+            f"Investment Plan Access Attempt: "
+            f"User {user_id}, Plan {plan_id}, Authorized: {authorized}"
+        )
+        
+        return {
+            'status': 'success',
+            'authorized': authorized,
+            'risk_level': plan.risk_level
+        }
+    
+    async def audit_investment_plan_access_async(
+        self, 
+        user_id: int, 
+        plan_id: int
+    ) -> Dict[str, Any]:
+        """
+        Awaitable wrapper around ``audit_investment_plan_access``
+        
+        Runs the blocking database lookup on the default executor so it
+        does not stall the event loop.
+        
+        Args:
+            user_id: User attempting access
+            plan_id: Investment plan identifier
+        
+        Returns:
+            Access audit results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, 
+            self.audit_investment_plan_access, 
+            user_id, 
+            plan_id
+        )
+    
     def _check_user_authorization(
         self, 
         user_id: int, 
@@ -145,21 +348,23 @@ class InvestmentPlanSecurityAudit:
         Returns:
             Encrypted plan data
         """
-        encrypted_data = plan_data.copy()
-        
-        # Fields to encrypt
-        sensitive_fields = [
-            'asset_allocation', 
-            'expected_return', 
-            'volatility'
-        ]
-        
-        for field in sensitive_fields:
-            if field in encrypted_data:
-                encrypted_value = self.encryption_cipher.encrypt(
-                    json.dumps(encrypted_data[field]).encode()
-                )
-                encrypted_data[field] = encrypted_value.decode()
+        # Split the record in one pass instead of copying it and popping
+        encrypted_data = {}
+        sensitive_values = {}
+        for key, value in plan_data.items():
+            if key in self.SENSITIVE_FIELDS:
+                sensitive_values[key] = value
+            else:
+                encrypted_data[key] = value
+        
+        # Encrypt all sensitive fields as a single blob: one serialization
+        # and one AEAD pass per record instead of one per field
+        if sensitive_values:
+            nonce = os.urandom(12)
+            ciphertext = self.encryption_cipher.encrypt(
+                nonce, _dumps(sensitive_values), None
+            )
+            encrypted_data['_enc'] = base64.b64encode(nonce + ciphertext).decode()
         
         return encrypted_data
     
@@ -176,21 +381,19 @@ class InvestmentPlanSecurityAudit:
         Returns:
             Decrypted plan data
         """
-        decrypted_data = encrypted_data.copy()
-        
-        # Fields to decrypt
-        sensitive_fields = [
-            'asset_allocation', 
-            'expected_return', 
-            'volatility'
-        ]
-        
-        for field in sensitive_fields:
-            if field in decrypted_data:
-                decrypted_value = self.encryption_cipher.decrypt(
-                    decrypted_data[field].encode()
-                )
-                decrypted_data[field] = json.loads(decrypted_value.decode())
+        blob = encrypted_data.get('_enc')
+        if blob is None:
+            return dict(encrypted_data)
+        
+        raw = base64.b64decode(blob)
+        decrypted_values = _loads(
+            self.encryption_cipher.decrypt(raw[:12], raw[12:], None)
+        )
+        
+        decrypted_data = {
+            key: value for key, value in encrypted_data.items() if key != '_enc'
+        }
+        decrypted_data.update(decrypted_values)
         
         return decrypted_data
     
@@ -217,14 +420,15 @@ class InvestmentPlanSecurityAudit:
         for key, value in plan_data.items():
             # Prevent SQL injection
             if isinstance(value, str):
-                if re.search(r'[\'";`]', value):
+                if self._INJECTION_RE.search(value):
                     validation_results['is_secure'] = False
                     validation_results['errors'].append(
                         f"Potential SQL injection in {key}"
                     )
             
             # Prevent excessive complexity
-            if isinstance(value, (dict, list)) and len(str(value)) > 10000:
+            elif (isinstance(value, (dict, list)) and
+                    _exceeds_size(value, self.MAX_VALUE_SIZE)):
                 validation_results['is_secure'] = False
                 validation_results['errors'].append(
                     f"Excessively large value for {key}"
@@ -265,12 +469,12 @@ class InvestmentPlanSecurityAudit:
         payload = {
             'user_id': user_id,
             'plan_id': plan_id,
-            'exp': datetime.utcnow() + timedelta(hours=1)
+            'exp': int(time.time()) + 3600  # 1 hour
         }
         
         return jwt.encode(
             payload, 
-            os.getenv('JWT_SECRET_KEY'), 
+            self._signing_key, 
             algorithm='HS256'
         )
     
@@ -311,7 +515,7 @@ class InvestmentPlanSecurityAudit:
             Encryption status details
         """
         return {
-            'encryption_method': 'Fernet',
+            'encryption_method': 'AES-GCM',
             'key_rotated_at': datetime.utcnow(),
             'key_length': len(self.encryption_key) * 8
         }
@@ -350,22 +554,22 @@ def main():
     # Validate plan configuration
     validation_result = security_audit.validate_plan_configuration(sample_plan)
     print("Plan Configuration Security:")
-    print(json.dumps(validation_result, indent=2))
+    print(_pretty(validation_result))
     
     # Encrypt sensitive data
     encrypted_plan = security_audit.encrypt_sensitive_plan_data(sample_plan)
     print("\nEncrypted Plan Data:")
-    print(json.dumps(encrypted_plan, indent=2))
+    print(_pretty(encrypted_plan))
     
     # Decrypt sensitive data
     decrypted_plan = security_audit.decrypt_sensitive_plan_data(encrypted_plan)
     print("\nDecrypted Plan Data:")
-    print(json.dumps(decrypted_plan, indent=2))
+    print(_pretty(decrypted_plan))
     
     # Perform system-wide security audit
     system_audit = security_audit.audit_investment_plan_system()
     print("\nSystem Security Audit:")
-    print(json.dumps(system_audit, indent=2))
+    print(_pretty(system_audit))
 
 if __name__ == '__main__':
     main()
@@ -3,10 +3,10 @@ import uuid
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 
 Base = declarative_base()
 
@@ -17,6 +17,11 @@ class InvestmentPlan(Base):
     Supports various investment strategies and configurations
     """
     __tablename__ = 'investment_plans'
+    __table_args__ = (
+        # Serve get_investment_plans filters with index seeks
+        Index('ix_plan_risk_mininv', 'risk_level', 'min_investment'),
+        Index('ix_plan_active', 'is_active'),
+    )
     
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
@@ -50,6 +55,26 @@ class InvestmentPlanManager:
     Handles creation, modification, and management of investment plans
     """
     
+    # Columns returned by get_investment_plans
+    _LISTING_COLUMNS = (
+        InvestmentPlan.id,
+        InvestmentPlan.name,
+        InvestmentPlan.description,
+        InvestmentPlan.risk_level,
+        InvestmentPlan.min_investment,
+        InvestmentPlan.expected_return,
+        InvestmentPlan.asset_allocation
+    )
+    
+    # Fields update_investment_plan may change
+    _UPDATABLE_FIELDS = frozenset((
+        'name', 'description', 'risk_level', 
+        'min_investment', 'max_investment',
+        'asset_allocation', 'expected_return',
+        'volatility', 'investment_duration',
+        'rebalancing_frequency', 'is_active'
+    ))
+    
     def __init__(self, database_url: Optional[str] = None):
         """
         Initialize Investment Plan Manager
@@ -62,8 +87,9 @@ class InvestmentPlanManager:
             'sqlite:///investment_plans.db'
         )
         
-        # Create engine and session
-        self.engine = create_engine(self.database_url)
+        # Create engine and session; pre-ping so pooled connections dropped
+        # by the server are replaced instead of failing the request
+        self.engine = create_engine(self.database_url, pool_pre_ping=True)
         Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
     
@@ -98,6 +124,80 @@ class InvestmentPlanManager:
         Returns:
             Created investment plan details
         """
+        return self.create_investment_plans([{
+            'name': name,
+            'description': description,
+            'risk_level': risk_level,
+            'min_investment': min_investment,
+            'max_investment': max_investment,
+            'asset_allocation': asset_allocation,
+            'expected_return': expected_return,
+            'volatility': volatility,
+            'investment_duration': investment_duration,
+            'rebalancing_frequency': rebalancing_frequency
+        }])[0]
+    
+    def create_investment_plans(
+        self, 
+        plans: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several investment plans in a single transaction
+        
+        Args:
+            plans: Plan definitions, each taking the keyword arguments
+                of ``create_investment_plan``
+        
+        Returns:
+            Created investment plan details, in input order
+        """
+        investment_plans = [self._build_investment_plan(**plan) for plan in plans]
+        
+        # Save to database: one session, one flush, one commit
+        session = self.Session()
+        try:
+            session.add_all(investment_plans)
+            session.flush()
+            
+            # Read generated values before commit expires the instances,
+            # which would otherwise cost one refresh query per plan
+            created = [
+                {
+                    'id': investment_plan.id,
+                    'name': investment_plan.name,
+                    'status': 'created',
+                    'created_at': investment_plan.created_at.isoformat()
+                }
+                for investment_plan in investment_plans
+            ]
+            
+            session.commit()
+            return created
+        except Exception as e:
+            session.rollback()
+            raise ValueError(f"Failed to create investment plan: {e}")
+        finally:
+            session.close()
+    
+    def _build_investment_plan(
+        self, 
+        name: str, 
+        description: str,
+        risk_level: str = 'medium',
+        min_investment: float = 1000.0,
+        max_investment: Optional[float] = None,
+        asset_allocation: Dict[str, float] = None,
+        expected_return: float = 0.05,
+        volatility: float = 0.1,
+        investment_duration: int = 12,
+        rebalancing_frequency: str = 'quarterly'
+    ) -> InvestmentPlan:
+        """
+        Validate a plan definition and build its model instance
+        
+        Returns:
+            Unsaved investment plan
+        """
         # Default asset allocation if not provided
         if asset_allocation is None:
             asset_allocation = {
@@ -110,8 +210,7 @@ class InvestmentPlanManager:
         if not (0 <= sum(asset_allocation.values()) <= 1):
             raise ValueError("Asset allocation must total 1.0 or less")
         
-        # Create investment plan
-        investment_plan = InvestmentPlan(
+        return InvestmentPlan(
             name=name,
             description=description,
             risk_level=risk_level,
@@ -123,29 +222,12 @@ class InvestmentPlanManager:
             investment_duration=investment_duration,
             rebalancing_frequency=rebalancing_frequency
         )
-        
-        # Save to database
-        session = self.Session()
-        try:
-            session.add(investment_plan)
-            session.commit()
-            
-            return {
-                'id': investment_plan.id,
-                'name': investment_plan.name,
-                'status': 'created',
-                'created_at': investment_plan.created_at.isoformat()
-            }
-        except Exception as e:
-            session.rollback()
-            raise ValueError(f"Failed to create investment plan: {e}")
-        finally:
-            session.close()
     
     def get_investment_plans(
         self, 
         risk_level: Optional[str] = None,
-        min_investment: Optional[float] = None
+        min_investment: Optional[float] = None,
+        active_only: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Retrieve investment plans
@@ -153,36 +235,29 @@ class InvestmentPlanManager:
         Args:
             risk_level: Filter by risk level
             min_investment: Minimum investment threshold
+            active_only: Exclude deactivated plans
         
         Returns:
             List of investment plans
         """
         session = self.Session()
         try:
-            query = session.query(InvestmentPlan)
+            # Select only the listed columns: rows come back as plain
+            # mappings without building and tracking ORM instances
+            stmt = select(*self._LISTING_COLUMNS)
+            
+            if active_only:
+                stmt = stmt.where(InvestmentPlan.is_active.is_(True))
             
             if risk_level:
-                query = query.filter(InvestmentPlan.risk_level == risk_level)
+                stmt = stmt.where(InvestmentPlan.risk_level == risk_level)
             
             if min_investment is not None:
-                query = query.filter(
+                stmt = stmt.where(
                     InvestmentPlan.min_investment <= min_investment
                 )
             
-            plans = query.all()
-            
-            return [
-                {
-                    'id': plan.id,
-                    'name': plan.name,
-                    'description': plan.description,
-                    'risk_level': plan.risk_level,
-                    'min_investment': plan.min_investment,
-                    'expected_return': plan.expected_return,
-                    'asset_allocation': plan.asset_allocation
-                }
-                for plan in plans
-            ]
+            return [dict(row) for row in session.execute(stmt).mappings()]
         finally:
             session.close()
     
@@ -203,22 +278,14 @@ class InvestmentPlanManager:
         """
         session = self.Session()
         try:
-            plan = session.query(InvestmentPlan).get(plan_id)
+            plan = session.get(InvestmentPlan, plan_id)
             
             if not plan:
                 raise ValueError(f"Investment plan {plan_id} not found")
             
             # Update allowed fields
-            allowed_fields = [
-                'name', 'description', 'risk_level', 
-                'min_investment', 'max_investment',
-                'asset_allocation', 'expected_return',
-                'volatility', 'investment_duration',
-                'rebalancing_frequency', 'is_active'
-            ]
-            
             for key, value in kwargs.items():
-                if key in allowed_fields:
+                if key in self._UPDATABLE_FIELDS:
                     setattr(plan, key, value)
             
             session.commit()
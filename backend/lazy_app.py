@@ -0,0 +1,44 @@
+import sys
+import importlib.util
+from types import ModuleType
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily
+
+    The module is registered in ``sys.modules`` immediately, but its body
+    only executes on first attribute access, so scripts that exit early
+    (usage errors, failed pre-checks) never pay its import cost.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        Lazily loaded module
+
+    Raises:
+        ImportError: If the module cannot be found
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Resolve ``lazy_app.app`` to the lazily loaded application package
+    """
+    if name == 'app':
+        module = lazy_import('app')
+        globals()['app'] = module
+        return module
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
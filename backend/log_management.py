@@ -1,13 +1,26 @@
 import os
+import time
+import atexit
+import queue
 import logging
-import json
 import socket
-from datetime import datetime
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import threading
+from logging.handlers import (
+    QueueListener, 
+    RotatingFileHandler, 
+    TimedRotatingFileHandler
+)
 import requests
-from elasticsearch import Elasticsearch
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from elasticsearch import Elasticsearch, helpers
 from pythonjsonlogger import jsonlogger
 
+from logging_config import RecordQueueHandler
+
+# Queued after the last event to stop the Elasticsearch shipper
+_STOP_SHIPPING = object()
+
 class LogManager:
     """
     Comprehensive Log Management System
@@ -20,6 +33,10 @@ class LogManager:
     - Centralized configuration
     """
     
+    # Shared instances by application name (see get_instance)
+    _instances = {}
+    _instances_lock = threading.Lock()
+    
     def __init__(self, app_name='coinage', log_dir=None):
         """
         Initialize log management system
@@ -46,8 +63,39 @@ class LogManager:
         # Elasticsearch configuration
         self.es_client = self._setup_elasticsearch()
         
+        # Log events are shipped to Elasticsearch in batches from a
+        # background thread; events beyond the queue bound are dropped
+        self.es_batch_size = 500
+        self.es_flush_interval = 1.0  # seconds
+        self.dropped_logs = 0
+        self._es_index = None
+        self._es_index_expires = 0.0
+        self._es_queue = queue.Queue(maxsize=10000)
+        
+        self._es_shipper = None
+        
+        if self.es_client:
+            self._es_shipper = threading.Thread(
+                target=self._drain_es_queue, 
+                name=f'{self.app_name}-log-shipper', 
+                daemon=True
+            )
+            self._es_shipper.start()
+            atexit.register(self._stop_es_shipper)
+        
         # Logging configuration
         self.logger = self._configure_logging()
+        
+        # Keep-alive HTTP session for alert webhooks; alerts are posted
+        # from a small worker pool so callers never wait on the network
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        self._alert_executor = ThreadPoolExecutor(
+            max_workers=2, 
+            thread_name_prefix=f'{self.app_name}-alerts'
+        )
     
     def _setup_elasticsearch(self):
         """
@@ -88,7 +136,6 @@ class LogManager:
         # Console Handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(json_formatter)
-        logger.addHandler(console_handler)
         
         # Rotating File Handler
         file_handler = RotatingFileHandler(
@@ -97,7 +144,6 @@ class LogManager:
             backupCount=5
         )
         file_handler.setFormatter(json_formatter)
-        logger.addHandler(file_handler)
         
         # Error Log Handler
         error_handler = TimedRotatingFileHandler(
@@ -108,7 +154,22 @@ class LogManager:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(json_formatter)
-        logger.addHandler(error_handler)
+        
+        # Callers only enqueue records; formatting and file/console I/O
+        # happen on the listener's background thread. Records keep their
+        # exc_info so the JSON formatter can render the exception itself.
+        log_queue = queue.Queue(-1)
+        logger.addHandler(RecordQueueHandler(log_queue))
+        
+        self._log_listener = QueueListener(
+            log_queue, 
+            console_handler, 
+            file_handler, 
+            error_handler, 
+            respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
         
         return logger
     
@@ -121,25 +182,20 @@ class LogManager:
             message: Log message
             extra: Additional context dictionary
         """
-        log_data = {
+        context = {
             'app_name': self.app_name,
-            'hostname': self.hostname,
-            'message': message
+            'hostname': self.hostname
         }
         
         if extra:
-            log_data.update(extra)
+            context.update(extra)
         
-        # Log to configured handlers
-        if level == logging.INFO:
-            self.logger.info(json.dumps(log_data))
-        elif level == logging.WARNING:
-            self.logger.warning(json.dumps(log_data))
-        elif level == logging.ERROR:
-            self.logger.error(json.dumps(log_data))
+        # Log to configured handlers; the JSON formatter serializes the
+        # context fields once, alongside the message
+        self.logger.log(level, message, extra=context)
         
         # Ship logs to Elasticsearch
-        self._ship_log_to_elasticsearch(level, log_data)
+        self._ship_log_to_elasticsearch(level, {**context, 'message': message})
     
     def _ship_log_to_elasticsearch(self, level, log_data):
         """
@@ -151,13 +207,78 @@ class LogManager:
         """
         if self.es_client:
             try:
-                self.es_client.index(
-                    index=f'{self.app_name}-logs-{datetime.now().strftime("%Y.%m.%d")}',
-                    body=log_data
-                )
+                self._es_queue.put_nowait({
+                    '_index': self._es_index_name(),
+                    '_source': log_data
+                })
+            except queue.Full:
+                # Never block the caller on a slow cluster
+                self.dropped_logs += 1
+    
+    def _es_index_name(self):
+        """
+        Name of today's Elasticsearch log index
+        
+        The name is formatted once per day and reused until local midnight.
+        
+        Returns:
+            Index name
+        """
+        now = time.time()
+        if now >= self._es_index_expires:
+            today = time.localtime(now)
+            self._es_index = f'{self.app_name}-logs-{time.strftime("%Y.%m.%d", today)}'
+            self._es_index_expires = time.mktime((
+                today.tm_year, today.tm_mon, today.tm_mday + 1, 0, 0, 0, 0, 0, -1
+            ))
+        return self._es_index
+    
+    def _drain_es_queue(self):
+        """
+        Ship queued log events to Elasticsearch in bulk requests
+        
+        Waits for the first event, then collects up to ``es_batch_size``
+        events or until ``es_flush_interval`` elapses, whichever is first.
+        Returns after shipping the events queued before the stop sentinel.
+        """
+        stopping = False
+        while not stopping:
+            event = self._es_queue.get()
+            if event is _STOP_SHIPPING:
+                return
+            
+            actions = [event]
+            deadline = time.monotonic() + self.es_flush_interval
+            
+            while len(actions) < self.es_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    event = self._es_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if event is _STOP_SHIPPING:
+                    stopping = True
+                    break
+                actions.append(event)
+            
+            try:
+                helpers.bulk(self.es_client, actions)
             except Exception as e:
                 logging.error(f"Log shipping to Elasticsearch failed: {e}")
     
+    def _stop_es_shipper(self):
+        """
+        Ship the final partial batch and stop the background shipper
+        """
+        if self._es_shipper is None or not self._es_shipper.is_alive():
+            return
+        
+        # Blocks only while the queue is full; the shipper keeps draining it
+        self._es_queue.put(_STOP_SHIPPING)
+        self._es_shipper.join()
+    
     def log_security_event(self, event_type, details):
         """
         Log security-related events
@@ -184,15 +305,27 @@ class LogManager:
         # Slack notification
         slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
         if slack_webhook:
-            try:
-                requests.post(slack_webhook, json={
-                    'text': f"*{severity.upper()} Alert*: {message}"
-                })
-            except Exception as e:
-                self.log(logging.ERROR, f"Slack alert failed: {e}")
+            self._alert_executor.submit(
+                self._post_alert, 
+                slack_webhook, 
+                {'text': f"*{severity.upper()} Alert*: {message}"}
+            )
         
         # Email notification can be added similarly
     
+    def _post_alert(self, url, payload):
+        """
+        Post an alert payload over the shared keep-alive session
+        
+        Args:
+            url: Webhook URL
+            payload: JSON payload
+        """
+        try:
+            self._http.post(url, json=payload, timeout=2.0)
+        except Exception as e:
+            self.log(logging.ERROR, f"Slack alert failed: {e}")
+    
     @classmethod
     def get_instance(cls, app_name='coinage'):
         """
@@ -204,9 +337,14 @@ class LogManager:
         Returns:
             LogManager instance
         """
-        if not hasattr(cls, '_instance'):
-            cls._instance = cls(app_name)
-        return cls._instance
+        # Lock-free fast path; the lock only guards first construction
+        instance = cls._instances.get(app_name)
+        if instance is None:
+            with cls._instances_lock:
+                instance = cls._instances.get(app_name)
+                if instance is None:
+                    instance = cls._instances[app_name] = cls(app_name)
+        return instance
 
 def main():
     """
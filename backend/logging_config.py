@@ -1,11 +1,45 @@
+import copy
+import queue
+import collections
+import atexit
 import logging
 import os
 import sys
 import json
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
-from datetime import datetime
+import time
+import threading
+from json.encoder import encode_basestring_ascii as _encode_string
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler
+)
 import socket
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON codec
+    orjson = None
+
+if orjson is not None:
+    # Hand datetimes and dataclasses to ``default`` and allow non-string
+    # keys, as json.dumps(default=str) does
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+# Current process id, refreshed in forked children
+_process_id = os.getpid()
+
+def _refresh_process_id():
+    global _process_id
+    _process_id = os.getpid()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_refresh_process_id)
+
 class ContextFilter(logging.Filter):
     """
     Adds contextual information to log records
@@ -16,16 +50,82 @@ class ContextFilter(logging.Filter):
 
     def filter(self, record):
         record.hostname = self.hostname
-        record.process_id = os.getpid()
+        record.process_id = _process_id
         return True
 
+# Per-thread cache of the formatted timestamp for the current second
+_timestamp_cache = threading.local()
+
+def _utc_timestamp(created):
+    """
+    ISO-8601 UTC timestamp for a record creation time
+
+    The seconds part is only re-formatted when the wall-clock second
+    changes; the microseconds are appended per record.
+    """
+    second = int(created)
+    if getattr(_timestamp_cache, 'second', None) != second:
+        _timestamp_cache.second = second
+        _timestamp_cache.text = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+    return f'{_timestamp_cache.text}.{int((created - second) * 1e6):06d}'
+
 class JsonFormatter(logging.Formatter):
     """
     Custom JSON log formatter for structured logging
+
+    Each record is encoded by a single encoder: orjson when installed,
+    otherwise the stdlib. The stdlib path assembles the string directly with
+    pre-rendered keys, producing the same output as ``json.dumps`` on the
+    equivalent dict. Values neither encoder supports are rendered with ``str``.
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Encoded form of the last hostname seen; it rarely changes
+        self._hostname = None
+        self._hostname_json = None
+
+    def _encode_hostname(self, hostname):
+        if hostname is not self._hostname:
+            self._hostname_json = _encode_string(str(hostname))
+            self._hostname = hostname
+        return self._hostname_json
+
     def format(self, record):
-        log_record = {
-            'timestamp': datetime.utcnow().isoformat(),
+        if orjson is not None:
+            return self._format_orjson(record)
+
+        parts = [
+            '{"timestamp": "', _utc_timestamp(record.created),
+            '", "level": ', _encode_string(record.levelname),
+            ', "logger": ', _encode_string(record.name),
+            ', "message": ', _encode_string(record.getMessage()),
+            ', "module": ', _encode_string(record.module),
+            ', "line": ', str(record.lineno),
+            ', "hostname": ', self._encode_hostname(getattr(record, 'hostname', 'unknown')),
+            ', "process_id": ', str(getattr(record, 'process_id', 0))
+        ]
+
+        # Security events carry their details as a structured field
+        security_details = getattr(record, 'security_details', None)
+        if security_details is not None:
+            parts.append(', "security_details": ')
+            parts.append(json.dumps(security_details, default=str))
+
+        # Add exception information if present
+        if record.exc_info:
+            parts.append(', "exception": ')
+            parts.append(_encode_string(self.formatException(record.exc_info)))
+
+        parts.append('}')
+        return ''.join(parts)
+
+    def _format_orjson(self, record):
+        """
+        Encode the whole record with orjson
+        """
+        log_data = {
+            'timestamp': _utc_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -35,11 +135,167 @@ class JsonFormatter(logging.Formatter):
             'process_id': getattr(record, 'process_id', 0)
         }
 
-        # Add exception information if present
+        security_details = getattr(record, 'security_details', None)
+        if security_details is not None:
+            log_data['security_details'] = security_details
+
         if record.exc_info:
-            log_record['exception'] = self.formatException(record.exc_info)
+            log_data['exception'] = self.formatException(record.exc_info)
+
+        return orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+
+class ErrorRingBuffer(logging.Filter):
+    """
+    Keeps summaries of the most recent ERROR and CRITICAL records in memory
+
+    Attached to the application log file handler, so errors are written
+    once to the main log and remain available through ``recent_errors``
+    without a second file handler. Only plain summaries are kept; holding
+    the records would also keep their tracebacks, frames and locals alive.
+    """
+    def __init__(self, maxlen=1000):
+        super().__init__()
+        self.errors = collections.deque(maxlen=maxlen)
+
+    def filter(self, record):
+        if record.levelno >= logging.ERROR:
+            self.errors.append({
+                'timestamp': _utc_timestamp(record.created),
+                'level': record.levelname,
+                'logger': record.name,
+                'message': record.getMessage(),
+                'module': record.module,
+                'line': record.lineno
+            })
+        return True
+
+# Recent error summaries, filled by the application log file handler
+error_ring_buffer = ErrorRingBuffer()
+
+def recent_errors():
+    """
+    Summaries of the most recent error records, oldest first
+    """
+    return [dict(error) for error in tuple(error_ring_buffer.errors)]
 
-        return json.dumps(log_record)
+class RecordQueueHandler(QueueHandler):
+    """
+    Queue handler that keeps exception info for the JSON formatter
+
+    The stock ``QueueHandler.prepare`` flattens the traceback into the
+    message; records here stay in-process, so only the message arguments
+    are resolved and ``exc_info`` is left for the listener's formatter.
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that batches writes
+
+    The stream is opened with a block-sized buffer and is not flushed per
+    record, so consecutive records reach the file in a few large writes.
+    Records at ``flush_level`` or above are flushed immediately; everything
+    else is flushed by ``flush`` (called periodically by ``setup_logging``),
+    on rollover and on close.
+
+    The file size is tracked in memory: the stock ``shouldRollover`` seeks
+    the stream for every record, and that seek flushes the buffer.
+    """
+    buffer_size = 64 * 1024
+    flush_level = logging.ERROR
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _should_rollover(self, length):
+        """
+        Check whether writing ``length`` more characters would exceed maxBytes
+        """
+        # Never roll over anything other than a regular file (bpo-45401)
+        return (
+            self.maxBytes > 0
+            and self._size + length >= self.maxBytes
+            and os.path.isfile(self.baseFilename)
+        )
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        return self._should_rollover(len(self.format(record)) + len(self.terminator))
+
+    def emit(self, record):
+        # Format once and count the size in characters; the JSON formatter
+        # only writes ASCII, so characters and bytes agree
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._should_rollover(len(msg)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(msg)
+            self._size += len(msg)
+
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# Interval between flushes of buffered log files, in seconds
+LOG_FLUSH_INTERVAL = 0.1
+
+def _flush_periodically(handler, stopped):
+    """
+    Flush a buffered handler every LOG_FLUSH_INTERVAL until stopped
+    """
+    while not stopped.wait(LOG_FLUSH_INTERVAL):
+        handler.flush()
+
+# Root handler for all setup_logging calls; records are enriched on the
+# caller's thread, then queued. Kept for the process lifetime so that
+# reconfiguring only swaps the listener draining its queue.
+_queue_handler = RecordQueueHandler(queue.SimpleQueue())
+_queue_handler.addFilter(ContextFilter())
+
+# Background listener writing queued records to the real handlers
+_queue_listener = None
+_flush_stopped = None
+
+def _stop_queue_listener():
+    """
+    Flush and stop the background log listener, if running
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+        # Write out anything still buffered and release the log files
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+    # Stop the periodic flusher only after the listener has drained
+    if _flush_stopped is not None:
+        _flush_stopped.set()
+
+atexit.register(_stop_queue_listener)
 
 def setup_logging(log_level=logging.INFO):
     """
@@ -50,51 +306,59 @@ def setup_logging(log_level=logging.INFO):
     - Rotating log files
     - JSON structured logging
     - Contextual logging
+    - Handler I/O on a background thread (callers only enqueue records)
     """
+    global _queue_listener, _flush_stopped
+
     # Ensure logs directory exists
     logs_dir = os.path.join(os.path.dirname(__file__), 'logs')
     os.makedirs(logs_dir, exist_ok=True)
 
-    # Context filter for additional log information
-    context_filter = ContextFilter()
-
     # JSON Formatter
     json_formatter = JsonFormatter()
 
     # Console Handler (colored output)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-    console_handler.addFilter(context_filter)
     console_handler.setFormatter(json_formatter)
 
-    # Rotating File Handler for all logs
-    file_handler = RotatingFileHandler(
+    # Rotating File Handler for all logs, written in buffered batches;
+    # errors are also kept in memory rather than written to a second file
+    file_handler = BufferedRotatingFileHandler(
         os.path.join(logs_dir, 'coinage_app.log'),
         maxBytes=10*1024*1024,  # 10 MB
         backupCount=5,
         encoding='utf-8'
     )
     file_handler.setLevel(log_level)
-    file_handler.addFilter(context_filter)
     file_handler.setFormatter(json_formatter)
+    file_handler.addFilter(error_ring_buffer)
 
-    # Time-based Rotating Handler for error logs
-    error_handler = TimedRotatingFileHandler(
-        os.path.join(logs_dir, 'coinage_errors.log'),
-        when='midnight',
-        interval=1,
-        backupCount=30,
-        encoding='utf-8'
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.addFilter(context_filter)
-    error_handler.setFormatter(json_formatter)
-
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        handlers=[console_handler, file_handler, error_handler]
+    _stop_queue_listener()
+
+    _queue_listener = QueueListener(
+        _queue_handler.queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
     )
+    _queue_listener.start()
+
+    # Bound the latency of buffered records
+    _flush_stopped = threading.Event()
+    threading.Thread(
+        target=_flush_periodically,
+        args=(file_handler, _flush_stopped),
+        name='log-flusher',
+        daemon=True
+    ).start()
+
+    # Configure root logger; attach the queue handler even if something
+    # configured root earlier (basicConfig would silently do nothing)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    if _queue_handler not in root_logger.handlers:
+        root_logger.addHandler(_queue_handler)
 
     # Create loggers for different components
     loggers = {
@@ -135,12 +399,13 @@ def log_security_event(event_type, details, severity=logging.INFO):
     """
     security_logger = get_logger('security')
     
-    event_log = {
-        'event_type': event_type,
-        'details': details
-    }
-    
-    security_logger.log(severity, json.dumps(event_log))
+    # The event type is the message; details are encoded once, by the
+    # formatter, as a JSON field of the record
+    security_logger.log(
+        severity, 
+        event_type, 
+        extra={'security_details': details}
+    )
 
 def main():
     """
@@ -1,18 +1,99 @@
 import os
 import sys
+import json
 import shutil
+import pathlib
+import itertools
 import traceback
 import importlib.util
+import importlib.metadata
 import subprocess
 import datetime
 
 # Add the backend directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Records a passing dependency check so unchanged environments skip it
+DEPENDENCY_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 
+    '.migrate_cache', 
+    'dependencies.json'
+)
+
+# Packages the migration tooling needs
+REQUIRED_PACKAGES = [
+    'flask', 
+    'flask-sqlalchemy', 
+    'flask-migrate', 
+    'flask-login', 
+    'flask-bcrypt', 
+    'flask-cors',
+    'python-dotenv'
+]
+
+def _installed_version(package):
+    """Installed version of a distribution, or None if it is missing"""
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+def _dependency_cache_key():
+    """Identify the environment the last passing check ran against"""
+    requirements_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 
+        'requirements.txt'
+    )
+    try:
+        requirements_mtime = os.path.getmtime(requirements_path)
+    except OSError:
+        requirements_mtime = None
+
+    # Uninstalling or upgrading a package changes its version, so a stale
+    # record cannot skip the check. Lists, so the key compares equal to its
+    # JSON round trip.
+    versions = [
+        [package, _installed_version(package)] for package in REQUIRED_PACKAGES
+    ]
+    return [sys.executable, requirements_mtime, versions]
+
+def _load_dependency_cache():
+    """Return the cached key of the last passing check, if any"""
+    try:
+        with open(DEPENDENCY_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except Exception:
+        # Missing, truncated or corrupt cache: run the full check
+        return None
+
+def _save_dependency_cache(key):
+    """Remember that the check passed for this key"""
+    try:
+        os.makedirs(os.path.dirname(DEPENDENCY_CACHE_PATH), exist_ok=True)
+        with open(DEPENDENCY_CACHE_PATH, 'w') as f:
+            json.dump(key, f)
+    except OSError:
+        pass
+
+# Keep pip from making its own version-check request or prompting
+PIP_INSTALL = [
+    sys.executable, '-m', 'pip', 'install', 
+    '--disable-pip-version-check', '--no-input'
+]
+
+def install_packages(packages):
+    """Install several packages with a single pip invocation"""
+    try:
+        subprocess.check_call([*PIP_INSTALL, *packages])
+        print(f"Successfully installed {', '.join(packages)}")
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
 def install_package(package):
     """Install a single package"""
     try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
+        subprocess.check_call([*PIP_INSTALL, package])
         print(f"Successfully installed {package}")
     except subprocess.CalledProcessError:
         print(f"Failed to install {package}")
@@ -21,35 +102,31 @@ def install_package(package):
 
 def check_and_install_dependencies():
     """Comprehensive dependency checking and installation"""
-    # List of required packages
-    required_packages = [
-        'flask', 
-        'flask-sqlalchemy', 
-        'flask-migrate', 
-        'flask-login', 
-        'flask-bcrypt', 
-        'flask-cors',
-        'python-dotenv'
-    ]
+    cache_key = _dependency_cache_key()
+    if _load_dependency_cache() == cache_key:
+        return
 
     # Track missing packages
     missing_packages = []
 
-    # Check each package
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+    # Check each package; find_spec locates it without running its imports
+    for package in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(package.replace('-', '_')) is None:
             print(f"Missing package: {package}")
             missing_packages.append(package)
 
     # Install missing packages
     if missing_packages:
         print(f"Installing missing packages: {missing_packages}")
-        for package in missing_packages:
-            if not install_package(package):
-                print(f"Critical: Unable to install {package}")
-                sys.exit(1)
+        
+        # Retry one at a time only to report which package failed
+        if not install_packages(missing_packages):
+            for package in missing_packages:
+                if not install_package(package):
+                    print(f"Critical: Unable to install {package}")
+                    sys.exit(1)
+
+    _save_dependency_cache(cache_key)
 
 def check_module_exists(module_name):
     """
@@ -71,24 +148,36 @@ def diagnose_import_error(module_name):
     """
     Provide detailed diagnosis for import errors
     
+    Only runs when the COINAGE_DIAGNOSE environment variable is set, since
+    it searches the app tree on disk.
+    
     Args:
         module_name (str): Full module path that failed to import
     """
+    if not os.environ.get('COINAGE_DIAGNOSE'):
+        print("ℹ️ Set COINAGE_DIAGNOSE=1 for a detailed import diagnosis")
+        return
+    
     print(f"\n🔍 Diagnosing import error for: {module_name}")
     
     # Check directory structure
     base_path = os.path.join(os.path.dirname(__file__), 'app')
     print(f"Checking directory: {base_path}")
     
-    # List all subdirectories and files
-    for root, dirs, files in os.walk(base_path):
-        relative_path = os.path.relpath(root, base_path)
-        print(f"\nDirectory: {relative_path}")
-        print("Subdirectories:", dirs)
-        print("Files:", files)
+    # Look for the missing module file, stopping after a few matches
+    module_parts = module_name.split('.')
+    matches = list(itertools.islice(
+        pathlib.Path(base_path).rglob(f'{module_parts[-1]}.py'), 
+        5
+    ))
+    if matches:
+        print("Candidate module files:")
+        for match in matches:
+            print(f"  {match}")
+    else:
+        print(f"No {module_parts[-1]}.py found under {base_path}")
     
     # Detailed path checks
-    module_parts = module_name.split('.')
     current_path = base_path
     for part in module_parts[1:]:
         current_path = os.path.join(current_path, part)
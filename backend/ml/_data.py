@@ -0,0 +1,55 @@
+"""
+Shared data loading and model persistence settings for the ml modules
+"""
+import os
+import importlib.util
+
+# Compress saved models with lz4 when installed, otherwise zlib
+MODEL_COMPRESSION = (
+    ('lz4', 3) if importlib.util.find_spec('lz4') is not None else ('zlib', 3)
+)
+
+# Column types of investment_history.csv, so the parser skips inference
+INVESTMENT_HISTORY_DTYPES = {
+    'market_volatility': 'float32',
+    'historical_returns': 'float32',
+    'risk_level': 'float32',
+    'investment_duration': 'float32',
+    'expected_return': 'float32'
+}
+
+def read_investment_history(csv_path):
+    """
+    Read the investment history CSV through a Parquet copy
+    
+    The CSV is parsed once and written alongside it as Parquet; later
+    loads read the Parquet file for as long as it is newer than the CSV.
+    Without pyarrow the CSV is parsed every time, by pandas' C parser.
+    """
+    import pandas as pd
+    
+    if importlib.util.find_spec('pyarrow') is None:
+        return pd.read_csv(
+            csv_path, 
+            engine='c', 
+            dtype=INVESTMENT_HISTORY_DTYPES, 
+            low_memory=False
+        )
+    
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    try:
+        if os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            return pd.read_parquet(parquet_path, engine='pyarrow')
+    except OSError:
+        pass
+    
+    data = pd.read_csv(
+        csv_path, 
+        engine='pyarrow', 
+        dtype=INVESTMENT_HISTORY_DTYPES
+    )
+    try:
+        data.to_parquet(parquet_path, engine='pyarrow', index=False)
+    except OSError:
+        pass
+    return data
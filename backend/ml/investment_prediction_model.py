@@ -1,13 +1,16 @@
 import os
-import numpy as np
-import pandas as pd
-import joblib
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TYPE_CHECKING
 
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+# numpy, pandas, scikit-learn and joblib are imported where they are used,
+# so importing this module stays cheap until a model is trained or loaded
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+try:
+    from ._data import MODEL_COMPRESSION, read_investment_history
+except ImportError:  # Run as a standalone script from backend/ml
+    from _data import MODEL_COMPRESSION, read_investment_history
 
 class InvestmentPredictionModel:
     def __init__(
@@ -25,19 +28,26 @@ class InvestmentPredictionModel:
         self.model_path = model_path
         self.data_path = data_path
         self.model = None
-        self.scaler = StandardScaler()
+        
+        # Reusable single-row input for predict_investment_return
+        self._buf = None
+        
+        # Fitted by prepare_features; inference only needs its statistics
+        self.scaler = None
+        self._mean = None
+        self._scale = None
         
         # Ensure model directory exists
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
     
-    def load_data(self) -> pd.DataFrame:
+    def load_data(self) -> 'pd.DataFrame':
         """
         Load investment historical data
         
         Returns:
             Preprocessed investment data
         """
-        data = pd.read_csv(self.data_path)
+        data = read_investment_history(self.data_path)
         
         # Basic preprocessing
         data.dropna(inplace=True)
@@ -46,8 +56,8 @@ class InvestmentPredictionModel:
     
     def prepare_features(
         self, 
-        data: pd.DataFrame
-    ) -> Dict[str, np.ndarray]:
+        data: 'pd.DataFrame'
+    ) -> Dict[str, 'np.ndarray']:
         """
         Prepare features and target for model training
         
@@ -57,6 +67,10 @@ class InvestmentPredictionModel:
         Returns:
             Dictionary of training and testing datasets
         """
+        import numpy as np
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        
         # Select relevant features
         features = [
             'market_volatility', 
@@ -66,38 +80,51 @@ class InvestmentPredictionModel:
         ]
         target = 'expected_return'
         
-        X = data[features]
-        y = data[target]
+        # Extract single-precision arrays once and split those directly,
+        # rather than splitting DataFrames and unboxing afterwards
+        X = data[features].to_numpy(dtype=np.float32, copy=False)
+        y = data[target].to_numpy(dtype=np.float32, copy=False)
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.2, random_state=42
         )
         
-        # Scale features
+        # Scale features in place; the split arrays are fresh copies
+        self.scaler = StandardScaler(copy=False)
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
+        self._mean = self.scaler.mean_.astype(np.float32)
+        self._scale = self.scaler.scale_.astype(np.float32)
+        
         return {
             'X_train': X_train_scaled,
             'X_test': X_test_scaled,
-            'y_train': y_train.values,
-            'y_test': y_test.values
+            'y_train': y_train,
+            'y_test': y_test
         }
     
     def train_model(self) -> Dict[str, Any]:
         """
-        Train RandomForest investment prediction model
+        Train gradient boosted investment prediction model
         
         Returns:
             Model training metrics
         """
+        import joblib
+        from sklearn.ensemble import HistGradientBoostingRegressor
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        
         data = self.load_data()
         datasets = self.prepare_features(data)
         
-        # Initialize and train model
-        self.model = RandomForestRegressor(
-            n_estimators=100, 
+        # Initialize and train model; features are binned once into
+        # histograms, so split finding scans small integer bins
+        self.model = HistGradientBoostingRegressor(
+            max_iter=200, 
+            learning_rate=0.05, 
+            max_bins=255, 
             random_state=42
         )
         
@@ -115,8 +142,13 @@ class InvestmentPredictionModel:
             'r2_score': r2_score(datasets['y_test'], y_pred)
         }
         
-        # Save model
-        joblib.dump(self.model, self.model_path)
+        # Save model together with the scaling it was trained behind
+        joblib.dump(
+            {'model': self.model, 'mean': self._mean, 'scale': self._scale}, 
+            self.model_path, 
+            compress=MODEL_COMPRESSION, 
+            protocol=5
+        )
         
         return metrics
     
@@ -133,15 +165,62 @@ class InvestmentPredictionModel:
         Returns:
             Predicted investment return
         """
-        # Load model if not already loaded
-        if self.model is None:
-            self.model = joblib.load(self.model_path)
+        import numpy as np
+        
+        self._ensure_loaded()
         
-        # Scale features
-        scaled_features = self.scaler.transform([investment_features])
+        # Fill the reusable row and standardize it in place
+        if self._buf is None or self._buf.shape[1] != len(investment_features):
+            self._buf = np.empty((1, len(investment_features)), dtype=np.float32)
+        self._buf[0, :] = investment_features
+        self._buf -= self._mean
+        self._buf /= self._scale
         
         # Predict
-        return float(self.model.predict(scaled_features)[0])
+        return float(self.model.predict(self._buf)[0])
+    
+    def predict_batch(self, features: 'np.ndarray') -> 'np.ndarray':
+        """
+        Predict investment returns for many feature rows
+        
+        Args:
+            features: Array of shape (n_samples, n_features); float32
+                input is used without conversion
+        
+        Returns:
+            Predicted investment returns
+        """
+        self._ensure_loaded()
+        
+        # Standardizing allocates the result, leaving the caller's array untouched
+        return self.model.predict((features - self._mean) / self._scale)
+    
+    def _ensure_loaded(self):
+        """
+        Load the persisted model and its scaling if not already loaded
+        
+        The model file holds a ``{'model', 'mean', 'scale'}`` dict. Files
+        written before the scaling was persisted hold a bare estimator and
+        cannot be used, since predictions need the training-set scaling.
+        
+        Raises:
+            ValueError: If the model file is in the old bare-estimator format
+        """
+        if self.model is not None:
+            return
+        
+        import joblib
+        
+        saved = joblib.load(self.model_path)
+        if not isinstance(saved, dict):
+            raise ValueError(
+                f"{self.model_path} was saved without its feature scaling; "
+                "retrain the model with train_model()"
+            )
+        
+        self.model = saved['model']
+        self._mean = saved['mean']
+        self._scale = saved['scale']
 
 def main():
     """
@@ -1,12 +1,8 @@
 import os
 import logging
-import mlflow
-import joblib
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
-import numpy as np
-import pandas as pd
+
+# mlflow, scikit-learn, numpy, pandas and joblib are imported where they
+# are used, so importing this module stays cheap
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +20,8 @@ class MLModelDeployment:
         self.model_dir = model_dir
         
         # MLflow tracking setup
+        import mlflow
+        
         mlflow.set_tracking_uri('file:///mlflow-tracking')
         mlflow.set_experiment('Coinage Investment Prediction')
     
@@ -34,32 +32,36 @@ class MLModelDeployment:
         Returns:
             Training and testing datasets
         """
-        np.random.seed(42)
+        import numpy as np
+        from sklearn.model_selection import train_test_split
+        
+        rng = np.random.default_rng(42)
         
-        # Simulate investment features
+        # Simulate investment features, one contiguous float32 row per
+        # column: age, income, risk tolerance, investment history, return
         n_samples = 1000
-        features = {
-            'age': np.random.normal(35, 10, n_samples),
-            'income': np.random.normal(75000, 25000, n_samples),
-            'risk_tolerance': np.random.uniform(0, 1, n_samples),
-            'investment_history': np.random.randint(0, 20, n_samples)
-        }
+        columns = np.empty((5, n_samples), dtype=np.float32)
+        age, income, risk_tolerance, investment_history, investment_return = columns
         
-        df = pd.DataFrame(features)
+        rng.standard_normal(out=age, dtype=np.float32)
+        age *= 10
+        age += 35
+        rng.standard_normal(out=income, dtype=np.float32)
+        income *= 25000
+        income += 75000
+        rng.random(out=risk_tolerance, dtype=np.float32)
+        investment_history[:] = rng.integers(0, 20, n_samples)
         
         # Synthetic target: investment return
-        df['investment_return'] = (
-            0.5 * df['age'] + 
-            0.3 * df['income'] / 10000 + 
-            20 * df['risk_tolerance'] - 
-            0.2 * df['investment_history'] + 
-            np.random.normal(0, 5, n_samples)
-        )
+        coefficients = np.array([0.5, 0.3 / 10000, 20, -0.2], dtype=np.float32)
+        np.dot(coefficients, columns[:4], out=investment_return)
+        investment_return += 5 * rng.standard_normal(n_samples, dtype=np.float32)
         
         return train_test_split(
-            df.drop('investment_return', axis=1), 
-            df['investment_return'], 
-            test_size=0.2
+            columns[:4].T, 
+            investment_return, 
+            test_size=0.2,
+            random_state=42
         )
     
     def train_model(self):
@@ -69,12 +71,19 @@ class MLModelDeployment:
         Returns:
             Trained model and performance metrics
         """
+        import mlflow
+        import mlflow.sklearn
+        from sklearn.ensemble import HistGradientBoostingRegressor
+        from sklearn.metrics import mean_squared_error, r2_score
+        
         X_train, X_test, y_train, y_test = self.prepare_training_data()
         
         with mlflow.start_run():
-            # Train Random Forest Regressor
-            model = RandomForestRegressor(
-                n_estimators=100, 
+            # Train histogram gradient boosting regressor
+            model = HistGradientBoostingRegressor(
+                max_iter=200, 
+                learning_rate=0.05, 
+                max_bins=255, 
                 random_state=42
             )
             model.fit(X_train, y_train)
@@ -106,6 +115,8 @@ class MLModelDeployment:
         Args:
             model: Trained ML model
         """
+        import joblib
+        
         model_path = os.path.join(self.model_dir, 'investment_predictor.pkl')
         joblib.dump(model, model_path)
         logger.info(f"Model saved to {model_path}")
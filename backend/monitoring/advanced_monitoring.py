@@ -38,6 +38,10 @@ class AdvancedMonitoringSystem:
         """
         self.service_name = service_name
         
+        # CPU usage sampled by record_system_metrics, shared with health reports
+        self._cpu_percent = None
+        self._cpu_count = psutil.cpu_count()
+        
         # Prometheus Metrics
         self._setup_prometheus_metrics()
         
@@ -165,7 +169,9 @@ class AdvancedMonitoringSystem:
         """
         Collect and record system resource metrics
         """
-        self.cpu_usage.set(psutil.cpu_percent())
+        self._cpu_percent = psutil.cpu_percent()
+        
+        self.cpu_usage.set(self._cpu_percent)
         self.memory_usage.set(psutil.virtual_memory().used)
         self.disk_usage.set(psutil.disk_usage('/').percent)
         
@@ -214,6 +220,16 @@ class AdvancedMonitoringSystem:
         Returns:
             System health details
         """
+        # One snapshot per resource; each psutil call is a separate syscall
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        
+        # Reuse the last periodic CPU sample: cpu_percent() measures since
+        # its previous call, so sampling again here would cover almost no time
+        cpu_percent = self._cpu_percent
+        if cpu_percent is None:
+            cpu_percent = psutil.cpu_percent()
+        
         return {
             'timestamp': datetime.utcnow().isoformat(),
             'hostname': socket.gethostname(),
@@ -223,18 +239,18 @@ class AdvancedMonitoringSystem:
                 'version': platform.version()
             },
             'cpu': {
-                'usage_percent': psutil.cpu_percent(),
-                'cores': psutil.cpu_count()
+                'usage_percent': cpu_percent,
+                'cores': self._cpu_count
             },
             'memory': {
-                'total': psutil.virtual_memory().total,
-                'available': psutil.virtual_memory().available,
-                'used_percent': psutil.virtual_memory().percent
+                'total': memory.total,
+                'available': memory.available,
+                'used_percent': memory.percent
             },
             'disk': {
-                'total': psutil.disk_usage('/').total,
-                'used': psutil.disk_usage('/').used,
-                'used_percent': psutil.disk_usage('/').percent
+                'total': disk.total,
+                'used': disk.used,
+                'used_percent': disk.percent
             },
             'network': {
                 'interfaces': list(psutil.net_if_stats().keys())
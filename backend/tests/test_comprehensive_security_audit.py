@@ -0,0 +1,92 @@
+import json
+import pytest
+
+import comprehensive_security_audit
+from comprehensive_security_audit import ComprehensiveSecurity
+
+def make_security(tmp_path, **config):
+    """
+    Create a ComprehensiveSecurity with configuration overrides
+    """
+    config_path = tmp_path / 'security.json'
+    config_path.write_text(json.dumps(config))
+    return ComprehensiveSecurity(config_path=str(config_path))
+
+@pytest.fixture(autouse=True)
+def isolated_calibration(tmp_path, monkeypatch):
+    """
+    Reset the per-process PBKDF2 calibration and keep the audit log in tmp_path
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(comprehensive_security_audit, '_PBKDF2_ITERATIONS', None)
+
+@pytest.fixture
+def security(tmp_path):
+    """
+    Fixture with a short PBKDF2 target so hashing stays fast
+    """
+    return make_security(
+        tmp_path,
+        pbkdf2_target_seconds=0.01,
+        pbkdf2_min_iterations=1000
+    )
+
+def test_calibration_runs_once_per_process(security, monkeypatch):
+    """
+    Test the work factor is measured once and then reused
+    """
+    iterations = security.get_pbkdf2_iterations()
+    assert iterations >= 1000
+
+    def fail_derive(*args):
+        raise AssertionError('calibration probe ran twice')
+
+    monkeypatch.setattr(security, '_derive_password_key', fail_derive)
+    assert security.get_pbkdf2_iterations() == iterations
+
+def test_calibration_respects_minimum(tmp_path):
+    """
+    Test a tiny time target cannot push iterations below the minimum
+    """
+    security = make_security(
+        tmp_path,
+        pbkdf2_target_seconds=1e-9,
+        pbkdf2_min_iterations=5000
+    )
+
+    assert security.get_pbkdf2_iterations() == 5000
+
+def test_hash_password_encodes_iterations(security):
+    """
+    Test hashes carry the algorithm, iteration count, salt and key
+    """
+    stored_hash = security.hash_password('Correct-Horse-1')
+    algorithm, iterations, salt, key = stored_hash.split('$')
+
+    assert algorithm == 'pbkdf2_sha256'
+    assert int(iterations) == security.get_pbkdf2_iterations()
+    assert stored_hash != security.hash_password('Correct-Horse-1')
+
+def test_verify_password(security):
+    """
+    Test verification accepts the right password and rejects others
+    """
+    stored_hash = security.hash_password('Correct-Horse-1')
+
+    assert security.verify_password('Correct-Horse-1', stored_hash)
+    assert not security.verify_password('Wrong-Horse-1', stored_hash)
+    assert not security.verify_password('Correct-Horse-1', 'not-a-hash')
+
+def test_verify_uses_stored_iterations(security, monkeypatch):
+    """
+    Test hashes stay valid after the host recalibrates to a new work factor
+    """
+    stored_hash = security.hash_password('Correct-Horse-1')
+
+    monkeypatch.setattr(
+        comprehensive_security_audit,
+        '_PBKDF2_ITERATIONS',
+        security.get_pbkdf2_iterations() * 2
+    )
+
+    assert security.verify_password('Correct-Horse-1', stored_hash)
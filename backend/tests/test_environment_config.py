@@ -0,0 +1,47 @@
+import pytest
+
+from environment_config import EnvironmentConfig
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """
+    Start and finish each test with no cached configurations
+    """
+    EnvironmentConfig.clear_cache()
+    yield
+    EnvironmentConfig.clear_cache()
+
+def test_get_config_returns_independent_copies():
+    """
+    Test changes to one caller's config do not reach later callers
+    """
+    config = EnvironmentConfig.get_config('testing')
+    secret_key = config['SECRET_KEY']
+    config['SECRET_KEY'] = ''
+
+    assert EnvironmentConfig.get_config('testing')['SECRET_KEY'] == secret_key
+
+def test_validate_config_rechecks_changed_config():
+    """
+    Test a validated config is checked again after it is changed
+    """
+    config = EnvironmentConfig.load_environment('testing')
+    EnvironmentConfig.validate_config(config)
+
+    config['SECRET_KEY'] = ''
+
+    with pytest.raises(ValueError, match='SECRET_KEY'):
+        EnvironmentConfig.validate_config(config)
+
+def test_validate_config_with_unhashable_values():
+    """
+    Test configs holding unhashable values are still validated
+    """
+    config = EnvironmentConfig.get_config('testing')
+    config['ALLOWED_HOSTS'] = ['localhost']
+    EnvironmentConfig.validate_config(config)
+
+    config['DEBUG'] = 'yes'
+
+    with pytest.raises(ValueError, match='DEBUG'):
+        EnvironmentConfig.validate_config(config)
@@ -0,0 +1,140 @@
+import json
+import pytest
+
+from feature_management.feature_prioritization import FeaturePrioritizationFramework
+
+def write_feature_request(directory, feature_id, priority_score, status='pending'):
+    """
+    Write a feature request file as another process would
+    """
+    feature_request = {
+        'feature_id': feature_id,
+        'feature_name': f'Feature {feature_id}',
+        'priority_score': priority_score,
+        'status': status
+    }
+    path = directory / f'{feature_id}_feature_request.json'
+    path.write_text(json.dumps(feature_request))
+    return feature_request
+
+@pytest.fixture
+def feature_request_dir(tmp_path):
+    """
+    Fixture providing an empty feature request directory
+    """
+    directory = tmp_path / 'feature_requests'
+    directory.mkdir()
+    return directory
+
+def test_index_loads_existing_requests(feature_request_dir):
+    """
+    Test requests already on disk are indexed at startup
+    """
+    write_feature_request(feature_request_dir, 'FEAT_1', 4.0)
+    write_feature_request(feature_request_dir, 'FEAT_2', 2.0, status='approved')
+    (feature_request_dir / 'notes.json').write_text('{}')
+
+    framework = FeaturePrioritizationFramework(str(feature_request_dir))
+
+    assert [f['feature_id'] for f in framework.get_feature_requests()] == [
+        'FEAT_1', 'FEAT_2'
+    ]
+    assert [f['feature_id'] for f in framework.get_feature_requests('approved')] == [
+        'FEAT_2'
+    ]
+
+def test_submit_updates_index_and_disk(feature_request_dir):
+    """
+    Test a submitted request is visible immediately and after a reload
+    """
+    framework = FeaturePrioritizationFramework(str(feature_request_dir))
+    feature_request = framework.submit_feature_request(
+        feature_name='Dark Mode',
+        description='Dark colour scheme',
+        requester='tester',
+        user_impact='high',
+        business_value='high'
+    )
+
+    assert framework.get_feature_requests() == [feature_request]
+
+    reloaded = FeaturePrioritizationFramework(str(feature_request_dir))
+    assert reloaded.get_feature_requests() == [feature_request]
+
+def test_update_status_persists(feature_request_dir):
+    """
+    Test status updates reach both the index and the stored file
+    """
+    write_feature_request(feature_request_dir, 'FEAT_1', 4.0)
+    framework = FeaturePrioritizationFramework(str(feature_request_dir))
+
+    assert framework.update_feature_request_status('FEAT_1', 'approved')
+    assert framework.get_feature_requests('approved')[0]['feature_id'] == 'FEAT_1'
+
+    stored = json.loads((feature_request_dir / 'FEAT_1_feature_request.json').read_text())
+    assert stored['status'] == 'approved'
+
+def test_update_status_of_unindexed_request(feature_request_dir):
+    """
+    Test requests written after startup can still be updated
+    """
+    framework = FeaturePrioritizationFramework(str(feature_request_dir))
+    write_feature_request(feature_request_dir, 'FEAT_LATE', 3.0)
+
+    assert framework.update_feature_request_status('FEAT_LATE', 'rejected')
+    assert framework.get_feature_requests('rejected')[0]['feature_id'] == 'FEAT_LATE'
+    assert not framework.update_feature_request_status('FEAT_MISSING', 'approved')
+
+def test_roadmap_bucket_boundaries(feature_request_dir):
+    """
+    Test scores of exactly 4.5 and 3.5 fall into the higher bucket
+    """
+    scores = {
+        'FEAT_A': 5.0,
+        'FEAT_B': 4.5,
+        'FEAT_C': 4.49,
+        'FEAT_D': 3.5,
+        'FEAT_E': 3.49,
+        'FEAT_F': 1.0
+    }
+    for feature_id, score in scores.items():
+        write_feature_request(feature_request_dir, feature_id, score)
+
+    framework = FeaturePrioritizationFramework(str(feature_request_dir))
+    roadmap = framework.generate_feature_roadmap()
+
+    buckets = {
+        term: [feature['feature_id'] for feature in features]
+        for term, features in roadmap.items()
+    }
+    assert buckets == {
+        'short_term': ['FEAT_A', 'FEAT_B'],
+        'medium_term': ['FEAT_C', 'FEAT_D'],
+        'long_term': ['FEAT_E', 'FEAT_F']
+    }
+
+def test_roadmap_single_bucket(feature_request_dir):
+    """
+    Test buckets may be empty when every score sits on one boundary
+    """
+    write_feature_request(feature_request_dir, 'FEAT_1', 3.5)
+    write_feature_request(feature_request_dir, 'FEAT_2', 3.5)
+
+    framework = FeaturePrioritizationFramework(str(feature_request_dir))
+    roadmap = framework.generate_feature_roadmap()
+
+    assert roadmap['short_term'] == []
+    assert len(roadmap['medium_term']) == 2
+    assert roadmap['long_term'] == []
+
+def test_roadmap_without_requests(feature_request_dir):
+    """
+    Test an empty directory yields empty buckets
+    """
+    framework = FeaturePrioritizationFramework(str(feature_request_dir))
+
+    assert framework.generate_feature_roadmap() == {
+        'short_term': [],
+        'medium_term': [],
+        'long_term': []
+    }
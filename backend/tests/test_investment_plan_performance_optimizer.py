@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import event
+
+from investment_plans import InvestmentPlanManager
+from investment_plan_performance_optimizer import InvestmentPlanPerformanceOptimizer
+
+@pytest.fixture
+def database_url(tmp_path):
+    """
+    Fixture providing a throwaway SQLite database URL
+    """
+    return f"sqlite:///{tmp_path / 'plans.db'}"
+
+@pytest.fixture
+def plan_ids(database_url):
+    """
+    Fixture creating three investment plans
+    """
+    plan_manager = InvestmentPlanManager(database_url=database_url)
+    created = plan_manager.create_investment_plans([
+        {
+            'name': f'Plan {index}',
+            'description': 'Test plan',
+            'asset_allocation': {'stocks': 0.5, 'bonds': 0.3, 'cash': 0.2}
+        }
+        for index in range(3)
+    ])
+    return [plan['id'] for plan in created]
+
+@pytest.fixture
+def optimizer(database_url):
+    """
+    Fixture to create an InvestmentPlanPerformanceOptimizer
+    """
+    optimizer = InvestmentPlanPerformanceOptimizer(database_url=database_url)
+    yield optimizer
+    optimizer.shutdown()
+
+def test_optimize_many_issues_one_select(optimizer, plan_ids):
+    """
+    Test optimizing several plans loads them with a single query
+    """
+    statements = []
+    event.listen(
+        optimizer.engine,
+        'before_cursor_execute',
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+
+    results = optimizer.optimize_many(plan_ids)
+
+    selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+    assert len(selects) == 1
+    assert all(results[plan_id]['status'] == 'success' for plan_id in plan_ids)
+    assert results[plan_ids[0]]['original_plan']['name'] == 'Plan 0'
+
+def test_optimize_many_reports_missing_plans(optimizer, plan_ids):
+    """
+    Test unknown plan ids are reported without failing the others
+    """
+    results = optimizer.optimize_many([plan_ids[0], 999999])
+
+    assert results[plan_ids[0]]['status'] == 'success'
+    assert results[999999]['status'] == 'error'
+
+def test_optimize_many_rejects_zero_weight_plan(optimizer, database_url, plan_ids):
+    """
+    Test a plan whose weights sum to zero fails alone, without NaN weights
+    """
+    plan_manager = InvestmentPlanManager(database_url=database_url)
+    zero_plan = plan_manager.create_investment_plan(
+        name='Empty Plan',
+        description='All weights zero',
+        asset_allocation={'stocks': 0.0, 'bonds': 0.0}
+    )
+
+    results = optimizer.optimize_many([plan_ids[0], zero_plan['id']])
+
+    assert results[zero_plan['id']]['status'] == 'error'
+    assert results[plan_ids[0]]['status'] == 'success'
+    weights = results[plan_ids[0]]['optimized_plan']['asset_allocation']
+    assert sum(weights.values()) == pytest.approx(1.0)
+
+def test_balanced_optimization_rejects_zero_weights(optimizer):
+    """
+    Test single-plan balancing raises instead of dividing by zero
+    """
+    plan_data = {
+        'name': 'Empty Plan',
+        'asset_allocation': {'stocks': 0.0},
+        'expected_return': 0.05,
+        'volatility': 0.1
+    }
+
+    with pytest.raises(ValueError):
+        optimizer._balanced_optimization(plan_data)
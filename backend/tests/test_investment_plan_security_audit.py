@@ -0,0 +1,133 @@
+import sys
+import types
+import json
+import base64
+import importlib
+import pytest
+from cryptography.exceptions import InvalidTag
+
+class StubSecurityMiddleware:
+    pass
+
+@pytest.fixture
+def audit_module(monkeypatch):
+    """
+    Import investment_plan_security_audit with app.utils.security stubbed
+
+    The real module pulls in the app package and its configuration, which
+    these encryption tests do not need.
+    """
+    security = types.ModuleType('app.utils.security')
+    security.SecurityMiddleware = StubSecurityMiddleware
+    for name in ('app', 'app.utils'):
+        package = types.ModuleType(name)
+        package.__path__ = []
+        monkeypatch.setitem(sys.modules, name, package)
+    monkeypatch.setitem(sys.modules, 'app.utils.security', security)
+
+    # Import afresh against the stub; monkeypatch restores sys.modules
+    monkeypatch.delitem(sys.modules, 'investment_plan_security_audit', raising=False)
+    module = importlib.import_module('investment_plan_security_audit')
+    monkeypatch.setitem(sys.modules, 'investment_plan_security_audit', module)
+    return module
+
+@pytest.fixture
+def security_audit(audit_module, tmp_path):
+    """
+    Fixture to create an InvestmentPlanSecurityAudit on a throwaway database
+    """
+    return audit_module.InvestmentPlanSecurityAudit(
+        database_url=f"sqlite:///{tmp_path / 'security.db'}"
+    )
+
+@pytest.fixture
+def plan_data():
+    """
+    Fixture providing a plan with sensitive and public fields
+    """
+    return {
+        'name': 'Balanced Growth',
+        'risk_level': 'medium',
+        'asset_allocation': {'stocks': 0.6, 'bonds': 0.3, 'cash': 0.1},
+        'expected_return': 0.07,
+        'volatility': 0.12
+    }
+
+def test_encrypt_decrypt_round_trip(security_audit, plan_data):
+    """
+    Test sensitive fields are hidden when encrypted and restored on decrypt
+    """
+    encrypted = security_audit.encrypt_sensitive_plan_data(plan_data)
+
+    assert encrypted['name'] == 'Balanced Growth'
+    assert encrypted['risk_level'] == 'medium'
+    for field in security_audit.SENSITIVE_FIELDS:
+        assert field not in encrypted
+
+    assert security_audit.decrypt_sensitive_plan_data(encrypted) == plan_data
+
+def test_encryption_uses_fresh_nonce(security_audit, plan_data):
+    """
+    Test encrypting the same plan twice produces different blobs
+    """
+    first = security_audit.encrypt_sensitive_plan_data(plan_data)
+    second = security_audit.encrypt_sensitive_plan_data(plan_data)
+
+    assert first['_enc'] != second['_enc']
+
+def test_decrypt_rejects_tampered_blob(security_audit, plan_data):
+    """
+    Test a modified ciphertext fails authentication instead of decrypting
+    """
+    encrypted = security_audit.encrypt_sensitive_plan_data(plan_data)
+
+    raw = bytearray(base64.b64decode(encrypted['_enc']))
+    raw[-1] ^= 0x01
+    encrypted['_enc'] = base64.b64encode(bytes(raw)).decode()
+
+    with pytest.raises(InvalidTag):
+        security_audit.decrypt_sensitive_plan_data(encrypted)
+
+def test_decrypt_rejects_other_key(audit_module, security_audit, tmp_path, plan_data):
+    """
+    Test a blob encrypted under one key cannot be read with another
+    """
+    encrypted = security_audit.encrypt_sensitive_plan_data(plan_data)
+    other_audit = audit_module.InvestmentPlanSecurityAudit(
+        database_url=f"sqlite:///{tmp_path / 'other.db'}"
+    )
+
+    with pytest.raises(InvalidTag):
+        other_audit.decrypt_sensitive_plan_data(encrypted)
+
+@pytest.mark.parametrize('value', [
+    {},
+    [],
+    {'stocks': 0.6, 'bonds': 0.3, 'cash': 0.1},
+    [1, 2.5, True, False, None, 'x'],
+    {'nested': {'weights': [0.5, 0.5], 'tags': []}, 'notes': 'line\nbreak "quoted" \\ é€'},
+    {1: 'int key', 2.5: 'float key', True: 'bool key', None: 'null key'},
+    [{'a': [{}]}, [[], [[]]], ('tuple', 1)],
+    {'history': [{'year': year, 'return': year / 1000} for year in range(2000, 2050)]}
+])
+def test_exceeds_size_matches_json_dumps(audit_module, value):
+    """
+    Test the size check agrees with len(json.dumps(value)) at the boundary
+    """
+    size = len(json.dumps(value))
+
+    assert not audit_module._exceeds_size(value, size)
+    assert audit_module._exceeds_size(value, size - 1)
+
+def test_validate_accepts_value_at_size_limit(security_audit):
+    """
+    Test a value whose JSON is exactly MAX_VALUE_SIZE characters is accepted
+    """
+    limit = security_audit.MAX_VALUE_SIZE
+    padding = limit - len(json.dumps({'notes': ''}))
+    at_limit = {'notes': 'n' * padding}
+    over_limit = {'notes': 'n' * (padding + 1)}
+    assert len(json.dumps(at_limit)) == limit
+
+    assert security_audit.validate_plan_configuration({'metadata': at_limit})['is_secure']
+    assert not security_audit.validate_plan_configuration({'metadata': over_limit})['is_secure']
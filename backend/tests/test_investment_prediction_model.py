@@ -0,0 +1,20 @@
+import pytest
+
+joblib = pytest.importorskip('joblib')
+
+from ml.investment_prediction_model import InvestmentPredictionModel
+
+class LegacyEstimator:
+    def predict(self, features):
+        return features
+
+def test_old_model_file_asks_for_retraining(tmp_path):
+    """
+    Test a bare estimator saved by older versions raises a clear error
+    """
+    model_path = tmp_path / 'models' / 'investment_predictor.joblib'
+    model = InvestmentPredictionModel(model_path=str(model_path))
+    joblib.dump(LegacyEstimator(), model_path)
+
+    with pytest.raises(ValueError, match='retrain'):
+        model.predict_batch(None)
@@ -0,0 +1,73 @@
+import json
+import uuid
+import logging
+import pytest
+
+import log_management
+from log_management import LogManager
+
+@pytest.fixture
+def log_manager(tmp_path):
+    """
+    Fixture to create a LogManager writing to a temporary directory
+    """
+    return LogManager(
+        app_name=f'test-{uuid.uuid4().hex[:8]}',
+        log_dir=str(tmp_path)
+    )
+
+def read_log_lines(log_manager, suffix=''):
+    """
+    Wait for the listener to handle queued records and return the parsed
+    JSON log lines
+    """
+    log_manager._log_listener.queue.join()
+    for handler in log_manager._log_listener.handlers:
+        handler.flush()
+
+    path = f'{log_manager.log_dir}/{log_manager.app_name}{suffix}.log'
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_exception_reaches_json_formatter(log_manager):
+    """
+    Test queued records keep exc_info for the JSON handlers
+    """
+    try:
+        raise ValueError('bad trade')
+    except ValueError:
+        log_manager.logger.exception('trade %s failed', 'T1')
+
+    for suffix in ('', '_errors'):
+        [entry] = read_log_lines(log_manager, suffix)
+        assert entry['message'] == 'trade T1 failed'
+        assert 'ValueError: bad trade' in entry['exc_info']
+
+def test_pending_events_shipped_on_stop(tmp_path, monkeypatch):
+    """
+    Test stopping the shipper sends the final partial batch
+    """
+    shipped = []
+    monkeypatch.setattr(LogManager, '_setup_elasticsearch', lambda self: object())
+    monkeypatch.setattr(
+        log_management.helpers,
+        'bulk',
+        lambda client, actions: shipped.extend(actions)
+    )
+
+    log_manager = LogManager(
+        app_name=f'test-{uuid.uuid4().hex[:8]}',
+        log_dir=str(tmp_path)
+    )
+    # Long enough that nothing ships before the stop
+    log_manager.es_flush_interval = 60.0
+
+    for index in range(3):
+        log_manager.log(logging.INFO, f'event {index}')
+
+    log_manager._stop_es_shipper()
+
+    assert not log_manager._es_shipper.is_alive()
+    assert [action['_source']['message'] for action in shipped] == [
+        'event 0', 'event 1', 'event 2'
+    ]
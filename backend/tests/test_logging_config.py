@@ -0,0 +1,230 @@
+import os
+import sys
+import json
+import uuid
+import decimal
+import datetime
+import logging
+import pytest
+
+import logging_config
+
+APP_LOG_PATH = os.path.join(
+    os.path.dirname(logging_config.__file__),
+    'logs',
+    'coinage_app.log'
+)
+
+@pytest.fixture
+def stop_logging():
+    """
+    Stop the background log listener after the test
+    """
+    yield
+    logging_config._stop_queue_listener()
+
+def read_app_log():
+    """
+    Drain the listener and return the application log contents
+    """
+    logging_config._stop_queue_listener()
+    with open(APP_LOG_PATH, encoding='utf-8') as f:
+        return f.read()
+
+def test_setup_logging_twice_keeps_logging(stop_logging):
+    """
+    Test records still reach the log file after reconfiguration
+    """
+    logging_config.setup_logging()
+    logging_config.setup_logging()
+
+    message = f"after reconfigure {uuid.uuid4().hex}"
+    logging_config.get_logger('app').info(message)
+
+    assert message in read_app_log()
+
+    # Only one queue handler is attached to the root logger
+    queue_handlers = [
+        handler for handler in logging.getLogger().handlers
+        if isinstance(handler, logging_config.RecordQueueHandler)
+    ]
+    assert len(queue_handlers) == 1
+
+def test_error_ring_buffer_keeps_summaries_only():
+    """
+    Test the error buffer stores plain summaries, not records with tracebacks
+    """
+    error_buffer = logging_config.ErrorRingBuffer(maxlen=2)
+
+    try:
+        raise RuntimeError('boom')
+    except RuntimeError:
+        record = logging.LogRecord(
+            'trading', logging.ERROR, __file__, 10,
+            'trade %s failed', ('T1',), sys.exc_info()
+        )
+
+    info_record = logging.LogRecord(
+        'trading', logging.INFO, __file__, 11, 'ignored', None, None
+    )
+
+    assert error_buffer.filter(record)
+    assert error_buffer.filter(info_record)
+
+    assert list(error_buffer.errors) == [{
+        'timestamp': logging_config._utc_timestamp(record.created),
+        'level': 'ERROR',
+        'logger': 'trading',
+        'message': 'trade T1 failed',
+        'module': record.module,
+        'line': 10
+    }]
+
+def make_record(message, args=None, exc_info=None):
+    """
+    Build a trading log record carrying the ContextFilter fields
+    """
+    record = logging.LogRecord(
+        'trading', logging.WARNING, __file__, 42, message, args, exc_info
+    )
+    record.hostname = 'host-"1"'
+    record.process_id = 1234
+    return record
+
+def test_json_formatter_escapes_message():
+    """
+    Test quotes, backslashes, newlines and non-ASCII text survive encoding
+    """
+    message = 'quote " backslash \\ newline \n tab \t unicode é€'
+    record = make_record('%s', (message,))
+
+    data = json.loads(logging_config.JsonFormatter().format(record))
+
+    assert data['message'] == message
+    assert data['level'] == 'WARNING'
+    assert data['logger'] == 'trading'
+    assert data['line'] == 42
+    assert data['hostname'] == 'host-"1"'
+    assert data['process_id'] == 1234
+    assert data['timestamp'] == logging_config._utc_timestamp(record.created)
+    assert 'exception' not in data
+
+def test_json_formatter_includes_exception():
+    """
+    Test exception tracebacks are included as a JSON string
+    """
+    try:
+        raise ValueError('bad "trade"')
+    except ValueError:
+        record = make_record('trade failed', exc_info=sys.exc_info())
+
+    data = json.loads(logging_config.JsonFormatter().format(record))
+
+    assert data['message'] == 'trade failed'
+    assert data['exception'].startswith('Traceback')
+    assert 'ValueError: bad "trade"' in data['exception']
+
+def test_json_formatter_includes_security_details():
+    """
+    Test security event details are encoded as a nested JSON object
+    """
+    details = {'username': 'al"ice', 'ip_address': '10.0.0.1', 'attempts': 3}
+    record = make_record('LOGIN_ATTEMPT')
+    record.security_details = details
+
+    data = json.loads(logging_config.JsonFormatter().format(record))
+
+    assert data['message'] == 'LOGIN_ATTEMPT'
+    assert data['security_details'] == details
+
+def format_security_record(details, use_orjson, monkeypatch):
+    """
+    Format a security record with or without orjson
+    """
+    if not use_orjson:
+        monkeypatch.setattr(logging_config, 'orjson', None)
+    record = make_record('LOGIN_ATTEMPT')
+    record.security_details = details
+    return logging_config.JsonFormatter().format(record)
+
+def test_json_formatter_stdlib_matches_json_dumps(monkeypatch):
+    """
+    Test the hand-assembled output is exactly json.dumps of the record
+    """
+    output = format_security_record({'ip_address': '10.0.0.1'}, False, monkeypatch)
+
+    assert output == json.dumps(json.loads(output))
+
+def test_json_formatter_encoders_agree(monkeypatch):
+    """
+    Test orjson and the stdlib render unsupported values the same way
+    """
+    pytest.importorskip('orjson')
+    details = {
+        'when': datetime.datetime(2024, 1, 2, 3, 4, 5),
+        'request_id': uuid.UUID(int=1),
+        'amount': decimal.Decimal('1.50'),
+        'roles': {'admin'},
+        7: 'numeric key'
+    }
+
+    with_orjson = json.loads(format_security_record(details, True, monkeypatch))
+    without_orjson = json.loads(format_security_record(details, False, monkeypatch))
+
+    # Records are created separately, so only the timestamps differ
+    del with_orjson['timestamp'], without_orjson['timestamp']
+    assert with_orjson == without_orjson
+    assert with_orjson['security_details'] == {
+        'when': '2024-01-02 03:04:05',
+        'request_id': '00000000-0000-0000-0000-000000000001',
+        'amount': '1.50',
+        'roles': "{'admin'}",
+        '7': 'numeric key'
+    }
+
+def make_file_handler(path, max_bytes):
+    """
+    Create a buffered rotating handler writing plain messages
+    """
+    handler = logging_config.BufferedRotatingFileHandler(
+        str(path), maxBytes=max_bytes, backupCount=2, encoding='utf-8'
+    )
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    return handler
+
+def test_file_handler_buffers_records(tmp_path):
+    """
+    Test records stay buffered until flushed, unless they are errors
+    """
+    path = tmp_path / 'app.log'
+    handler = make_file_handler(path, max_bytes=10 * 1024 * 1024)
+
+    for index in range(50):
+        handler.handle(make_record(f'record {index:02d} ' + 'x' * 100))
+    assert path.stat().st_size == 0
+
+    handler.flush()
+    assert path.read_text().count('\n') == 50
+
+    error = make_record('trade failed')
+    error.levelno = logging.ERROR
+    handler.handle(error)
+    assert path.read_text().endswith('trade failed\n')
+
+    handler.close()
+
+def test_file_handler_rolls_over_by_tracked_size(tmp_path):
+    """
+    Test rollover happens at maxBytes without seeking the stream
+    """
+    path = tmp_path / 'app.log'
+    path.write_text('a' * 50 + '\n')
+    handler = make_file_handler(path, max_bytes=100)
+
+    # 51 bytes already on disk; the first 49-byte line still fits
+    handler.handle(make_record('b' * 47))
+    handler.handle(make_record('c' * 47))
+    handler.close()
+
+    assert (tmp_path / 'app.log.1').read_text() == 'a' * 50 + '\n' + 'b' * 47 + '\n'
+    assert path.read_text() == 'c' * 47 + '\n'
@@ -0,0 +1,91 @@
+import os
+import logging
+import importlib.util
+import pytest
+from flask import Flask
+from flask_login import LoginManager, UserMixin
+
+import logging_config
+
+# app/routes/main.py is loaded from its file so the test does not depend
+# on the full application factory and its database configuration
+MAIN_ROUTES_PATH = os.path.join(
+    os.path.dirname(logging_config.__file__),
+    'app',
+    'routes',
+    'main.py'
+)
+
+class StubUser(UserMixin):
+    def __init__(self, user_id, is_admin):
+        self.id = user_id
+        self.is_admin = is_admin
+
+USERS = {
+    '1': StubUser('1', is_admin=True),
+    '2': StubUser('2', is_admin=False)
+}
+
+def load_main_blueprint():
+    """
+    Import the main routes module and return its blueprint
+    """
+    spec = importlib.util.spec_from_file_location('main_routes', MAIN_ROUTES_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main_bp
+
+@pytest.fixture
+def client():
+    """
+    Fixture providing a test client with the main blueprint and stub users
+    """
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'test-secret'
+    app.config['TESTING'] = True
+
+    login_manager = LoginManager(app)
+    login_manager.user_loader(USERS.get)
+
+    app.register_blueprint(load_main_blueprint())
+    return app.test_client()
+
+def login(client, user_id):
+    """
+    Mark the test client's session as logged in as the given user
+    """
+    with client.session_transaction() as session:
+        session['_user_id'] = user_id
+
+def test_admin_errors_requires_login(client):
+    """
+    Test anonymous requests are rejected
+    """
+    response = client.get('/admin/errors')
+
+    assert response.status_code == 401
+
+def test_admin_errors_rejects_non_admin(client):
+    """
+    Test non-admin users cannot read recent errors
+    """
+    login(client, '2')
+
+    response = client.get('/admin/errors')
+
+    assert response.status_code == 403
+
+def test_admin_errors_lists_recent_errors(client):
+    """
+    Test admins receive the buffered error summaries
+    """
+    record = logging.LogRecord(
+        'payments', logging.ERROR, __file__, 1, 'payout failed', None, None
+    )
+    logging_config.error_ring_buffer.filter(record)
+    login(client, '1')
+
+    response = client.get('/admin/errors')
+
+    assert response.status_code == 200
+    assert response.get_json()['errors'][-1]['message'] == 'payout failed'
@@ -0,0 +1,78 @@
+import pickle
+import pytest
+
+import migrate
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """
+    Fixture pointing the dependency cache at a throwaway file
+    """
+    path = tmp_path / 'dependencies.json'
+    monkeypatch.setattr(migrate, 'DEPENDENCY_CACHE_PATH', str(path))
+    return path
+
+@pytest.mark.parametrize('contents', [
+    b'',
+    b'["python", 1.0',
+    b'not json',
+    b'\xff\xfe\x00'
+])
+def test_corrupt_cache_falls_back_to_full_check(cache_path, contents):
+    """
+    Test empty, truncated or garbled cache files are ignored
+    """
+    cache_path.write_bytes(contents)
+
+    assert migrate._load_dependency_cache() is None
+
+def test_cache_round_trip(cache_path):
+    """
+    Test a saved key is read back unchanged
+    """
+    key = migrate._dependency_cache_key()
+    migrate._save_dependency_cache(key)
+
+    assert migrate._load_dependency_cache() == key
+
+def test_cache_key_tracks_installed_versions(monkeypatch):
+    """
+    Test upgrading or removing a required package changes the cache key
+    """
+    versions = {package: '1.0' for package in migrate.REQUIRED_PACKAGES}
+    monkeypatch.setattr(migrate, '_installed_version', versions.get)
+    key = migrate._dependency_cache_key()
+
+    versions['flask'] = '2.0'
+    upgraded_key = migrate._dependency_cache_key()
+
+    versions['flask'] = None
+    removed_key = migrate._dependency_cache_key()
+
+    assert key != upgraded_key
+    assert key != removed_key
+    assert upgraded_key != removed_key
+
+def test_cache_is_not_executed(cache_path):
+    """
+    Test a pickle planted in the cache is not loaded as code
+    """
+    class Payload:
+        def __reduce__(self):
+            return (exec, ("raise AssertionError('cache executed')",))
+
+    cache_path.write_bytes(pickle.dumps(Payload()))
+
+    assert migrate._load_dependency_cache() is None
+
+def test_matching_cache_skips_check(cache_path, monkeypatch):
+    """
+    Test an up-to-date cache skips the package lookups entirely
+    """
+    migrate._save_dependency_cache(migrate._dependency_cache_key())
+
+    def fail_find_spec(name):
+        raise AssertionError('dependency check ran despite a valid cache')
+
+    monkeypatch.setattr(migrate.importlib.util, 'find_spec', fail_find_spec)
+    migrate.check_and_install_dependencies()